@@ -0,0 +1,332 @@
+import sys
+import json
+import time
+import random
+import importlib
+import multiprocessing
+from functools import reduce
+from itertools import groupby
+from argparse import ArgumentParser
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+""" Example---To benchmark the evaluator and check every mode and API against the reference evaluator.
+
+$ python bench_hand_evaluator.py -n 20000 -d 1000000 -c table bitmask batch board_state -o bench.json
+
+The reference is the original category scan evaluator (eval_reference below), which shares
+no code with the rank tables. "-r table" checks against HandEvaluator.eval_hand instead.
+
+An alternative evaluator outside this file is given as "module:function", where
+function(hole, community) returns the same score as HandEvaluator.eval_hand.
+"""
+
+CATEGORIES = ["HIGHCARD", "ONEPAIR", "TWOPAIR", "THREECARD", "STRAIGHT", "FLASH", "FULLHOUSE", "FOURCARD", "STRAIGHTFLASH"]
+SUITS = [Card.CLUB, Card.DIAMOND, Card.HEART, Card.SPADE]
+RANKS = list(range(2, 15))
+
+
+""" =========== Hand generators =========== """
+
+def gen_random_hand(rng, card_num):
+    return [Card.from_id(card_id) for card_id in rng.sample(range(1, 53), card_num)]
+
+
+def fill_hand(rng, cards, card_num):
+    used = [card.to_id() for card in cards]
+    unused = [card_id for card_id in range(1, 53) if card_id not in used]
+    hand = cards + [Card.from_id(card_id) for card_id in rng.sample(unused, card_num - len(cards))]
+    rng.shuffle(hand)
+    return hand
+
+
+def gen_category_seed(rng, category):
+    suit = rng.choice(SUITS)
+    if category == "STRAIGHTFLASH":
+        low = rng.randint(2, 10)
+        return [Card(suit, rank) for rank in range(low, low + 5)]
+    if category == "FOURCARD":
+        rank = rng.choice(RANKS)
+        return [Card(s, rank) for s in SUITS]
+    if category == "FULLHOUSE":
+        three, two = rng.sample(RANKS, 2)
+        return [Card(s, three) for s in rng.sample(SUITS, 3)] + [Card(s, two) for s in rng.sample(SUITS, 2)]
+    if category == "FLASH":
+        return [Card(suit, rank) for rank in rng.sample(RANKS, 5)]
+    if category == "STRAIGHT":
+        low = rng.randint(2, 10)
+        return [Card(rng.choice(SUITS), rank) for rank in range(low, low + 5)]
+    return []
+
+
+def gen_category_hand(rng, category, card_num):
+    while True:
+        hand = fill_hand(rng, gen_category_seed(rng, category), card_num)
+        if HandEvaluator.get_hand_strength(HandEvaluator.eval_hand(hand[:2], hand[2:])) == category:
+            return hand
+
+
+# Hands which stress the corner cases of the evaluator
+def gen_adversarial_hand(rng, card_num):
+    kind = rng.randint(0, 5)
+    suit = rng.choice(SUITS)
+    if kind == 0:  # wheel straight (A is not low in this engine)
+        cards = [Card(rng.choice(SUITS), rank) for rank in [14, 2, 3, 4, 5]]
+    elif kind == 1:  # multiple threecards
+        ranks = rng.sample(RANKS, 2)
+        cards = [Card(s, rank) for rank in ranks for s in rng.sample(SUITS, 3)]
+    elif kind == 2:  # flash and straight but not straight flash
+        low = rng.randint(2, 10)
+        cards = [Card(suit if rank != low + 2 else rng.choice([s for s in SUITS if s != suit]), rank) for rank in range(low, low + 5)]
+        cards += [Card(suit, rank) for rank in rng.sample([r for r in RANKS if not low <= r < low + 5], 2)]
+    elif kind == 3:  # three pairs
+        cards = [Card(s, rank) for rank in rng.sample(RANKS, 3) for s in rng.sample(SUITS, 2)]
+    elif kind == 4:  # fourcard and threecard
+        four, three = rng.sample(RANKS, 2)
+        cards = [Card(s, four) for s in SUITS] + [Card(s, three) for s in rng.sample(SUITS, 3)]
+    else:  # six or seven cards of one suit with a straight flash inside
+        low = rng.randint(2, 9)
+        cards = [Card(suit, rank) for rank in range(low, low + 6)]
+    cards = _drop_duplicates(cards)[:card_num]
+    return fill_hand(rng, cards, card_num)
+
+
+def _drop_duplicates(cards):
+    unique = []
+    for card in cards:
+        if card not in unique: unique.append(card)
+    return unique
+
+
+""" =========== Reference evaluator =========== """
+
+# The category scan evaluator which HandEvaluator used before the rank tables.
+# It is kept here as an independent oracle of the differential check.
+def eval_reference(hole, community):
+    ranks = sorted([card.rank for card in hole])
+    hole_flg = ranks[1] << 4 | ranks[0]
+    return _reference_hand_info_flg(hole, community) << 8 | hole_flg
+
+
+def _reference_hand_info_flg(hole, community):
+    cards = hole + community
+    straightflash = _search_straight(_search_flash_cards(cards))
+    if straightflash != -1: return HandEvaluator.STRAIGHTFLASH | straightflash << 4
+    fourcard = _search_fourcard(cards)
+    if fourcard: return HandEvaluator.FOURCARD | fourcard << 4
+    three, two = _search_fullhouse(cards)
+    if three and two: return HandEvaluator.FULLHOUSE | three << 4 | two
+    flash = _search_flash(cards)
+    if flash != -1: return HandEvaluator.FLASH | flash << 4
+    straight = _search_straight(cards)
+    if straight != -1: return HandEvaluator.STRAIGHT | straight << 4
+    threecard = _search_threecard(cards)
+    if threecard != -1: return HandEvaluator.THREECARD | threecard << 4
+    twopair = _search_twopair(cards)
+    if len(twopair) == 2: return HandEvaluator.TWOPAIR | twopair[0] << 4 | twopair[1]
+    onepair = _search_onepair(cards)
+    if onepair: return HandEvaluator.ONEPAIR | onepair << 4
+    ranks = sorted([card.rank for card in hole])
+    return ranks[1] << 4 | ranks[0]
+
+
+def _search_onepair(cards):
+    rank, memo = 0, 0
+    for card in cards:
+        mask = 1 << card.rank
+        if memo & mask != 0: rank = max(rank, card.rank)
+        memo |= mask
+    return rank
+
+
+def _search_twopair(cards):
+    ranks, memo = [], 0
+    for card in cards:
+        mask = 1 << card.rank
+        if memo & mask != 0: ranks.append(card.rank)
+        memo |= mask
+    return sorted(ranks)[::-1][:2]
+
+
+def _search_threecard(cards):
+    rank = -1
+    bit_memo = reduce(lambda memo, card: memo + (1 << (card.rank - 1) * 3), cards, 0)
+    for r in range(2, 15):
+        bit_memo >>= 3
+        if bit_memo & 7 >= 3: rank = r
+    return rank
+
+
+def _search_straight(cards):
+    bit_memo = reduce(lambda memo, card: memo | 1 << card.rank, cards, 0)
+    rank = -1
+    for r in range(2, 15):
+        if all([bit_memo >> (r + i) & 1 for i in range(5)]): rank = r
+    return rank
+
+
+def _search_flash_cards(cards):
+    flash_cards = []
+    fetch_suit = lambda card: card.suit
+    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
+        g = list(group_obj)
+        if len(g) >= 5: flash_cards = g
+    return flash_cards
+
+
+def _search_flash(cards):
+    best_suit_rank = -1
+    fetch_suit = lambda card: card.suit
+    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
+        g = list(group_obj)
+        if len(g) >= 5: best_suit_rank = max(best_suit_rank, max([card.rank for card in g]))
+    return best_suit_rank
+
+
+def _search_fullhouse(cards):
+    fetch_rank = lambda card: card.rank
+    three_card_ranks, two_pair_ranks = [], []
+    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
+        g = list(group_obj)
+        if len(g) >= 3: three_card_ranks.append(rank)
+        if len(g) >= 2: two_pair_ranks.append(rank)
+    two_pair_ranks = [rank for rank in two_pair_ranks if not rank in three_card_ranks]
+    if len(three_card_ranks) == 2: two_pair_ranks.append(min(three_card_ranks))
+    max_ = lambda l: None if len(l) == 0 else max(l)
+    return max_(three_card_ranks), max_(two_pair_ranks)
+
+
+def _search_fourcard(cards):
+    fetch_rank = lambda card: card.rank
+    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
+        if len(list(group_obj)) >= 4: return rank
+    return 0
+
+
+""" =========== Evaluators =========== """
+
+def eval_with_mode(mode):
+    def evaluate(hands):
+        original = HandEvaluator.get_mode()
+        HandEvaluator.set_mode(mode)
+        try:
+            return [HandEvaluator.eval_hand(hand[:2], hand[2:]) for hand in hands]
+        finally:
+            HandEvaluator.set_mode(original)
+    return evaluate
+
+
+def eval_on_board_state(hands):
+    return [HandEvaluator.eval_hand_on_board(hand[:2], HandEvaluator.gen_board_state(hand[2:])) for hand in hands]
+
+
+def eval_in_batch(hands):
+    ids = [[card.to_id() for card in hand] for hand in hands]
+    return [int(score) for score in HandEvaluator.eval_hand_batch([i[:2] for i in ids], [i[2:] for i in ids])]
+
+
+BUILTIN_EVALUATORS = {
+        "reference": lambda hands: [eval_reference(hand[:2], hand[2:]) for hand in hands],
+        "table": eval_with_mode(HandEvaluator.TABLE_MODE),
+        "bitmask": eval_with_mode(HandEvaluator.BITMASK_MODE),
+        "board_state": eval_on_board_state,
+        "batch": eval_in_batch
+        }
+
+
+def resolve_evaluator(name):
+    if name in BUILTIN_EVALUATORS: return BUILTIN_EVALUATORS[name]
+    module_name, attr_path = name.split(":")
+    function = importlib.import_module(module_name)
+    for attr in attr_path.split("."): function = getattr(function, attr)
+    return lambda hands: [function(hand[:2], hand[2:]) for hand in hands]
+
+
+""" =========== Benchmark =========== """
+
+def measure(function, hands):
+    start = time.time()
+    for hand in hands: function(hand[:2], hand[2:])
+    return len(hands) / (time.time() - start)
+
+
+def run_benchmark(nb_hand, card_nums, seed):
+    rng = random.Random(seed)
+    results = []
+    for card_num in card_nums:
+        hand_sets = [("RANDOM", [gen_random_hand(rng, card_num) for _ in range(nb_hand)])]
+        hand_sets += [(category, [gen_category_hand(rng, category, card_num) for _ in range(nb_hand)]) for category in CATEGORIES]
+        for mode in [HandEvaluator.TABLE_MODE, HandEvaluator.BITMASK_MODE]:
+            HandEvaluator.set_mode(mode)
+            for category, hands in hand_sets:
+                for name, function in [("eval_hand", HandEvaluator.eval_hand), ("gen_hand_rank_info", HandEvaluator.gen_hand_rank_info)]:
+                    results.append({
+                        "function": name, "mode": mode, "card_num": card_num,
+                        "category": category, "hands_per_sec": measure(function, hands)
+                        })
+        HandEvaluator.set_mode(HandEvaluator.TABLE_MODE)
+    return results
+
+
+""" =========== Differential check =========== """
+
+def check_chunk(args):
+    candidate, reference, card_num, nb_hand, seed = args
+    rng = random.Random(seed)
+    evaluate = resolve_evaluator(candidate)
+    hands = [gen_adversarial_hand(rng, card_num) if i % 4 == 0 else gen_random_hand(rng, card_num) for i in range(nb_hand)]
+    expected = resolve_evaluator(reference)(hands)
+    mismatches = [(hand, e, a) for hand, e, a in zip(hands, expected, evaluate(hands)) if e != a]
+    examples = [{"hole": [str(c) for c in hand[:2]], "community": [str(c) for c in hand[2:]], "expected": e, "actual": a}
+            for hand, e, a in mismatches[:5]]
+    return len(mismatches), examples
+
+
+def run_differential_check(candidates, reference, nb_hand, card_num, processes, seed, chunk_size=20000):
+    chunks = [min(chunk_size, nb_hand - start) for start in range(0, nb_hand, chunk_size)]
+    pool = multiprocessing.Pool(processes)
+    results = []
+    try:
+        for candidate in candidates:
+            jobs = [(candidate, reference, card_num, size, seed * 1000003 + i) for i, size in enumerate(chunks)]
+            counts = pool.map(check_chunk, jobs)
+            results.append({
+                "candidate": candidate, "reference": reference, "card_num": card_num, "hands": nb_hand,
+                "mismatches": sum([count for count, _ in counts]),
+                "examples": sum([examples for _, examples in counts], [])[:5]
+                })
+    finally:
+        pool.close()
+        pool.join()
+    return results
+
+
+def parse_arguments():
+    parser = ArgumentParser()
+    parser.add_argument('-n', '--nb_hand', help="Hands per benchmark case (0 to skip)", default=20000, type=int)
+    parser.add_argument('-k', '--card_num', help="Card numbers to benchmark", default=[5, 6, 7], type=int, nargs='+')
+    parser.add_argument('-d', '--diff_hands', help="Hands per differential check (0 to skip)", default=1000000, type=int)
+    parser.add_argument('-c', '--candidates', help="Evaluators checked against the reference", default=["table", "bitmask", "board_state", "batch"], nargs='+')
+    parser.add_argument('-r', '--reference', help="Evaluator the candidates are checked against", default="reference", type=str)
+    parser.add_argument('-p', '--processes', help="Worker processes of the differential check", default=multiprocessing.cpu_count(), type=int)
+    parser.add_argument('-s', '--seed', help="Random seed", default=0, type=int)
+    parser.add_argument('-o', '--output', help="Path of the JSON report (stdout if omitted)", default=None, type=str)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    report = {"python": sys.version.split()[0], "seed": args.seed}
+    if args.nb_hand > 0:
+        report["benchmark"] = run_benchmark(args.nb_hand, args.card_num, args.seed)
+    if args.diff_hands > 0:
+        report["differential"] = [result for card_num in args.card_num for result in
+                run_differential_check(args.candidates, args.reference, args.diff_hands, card_num, args.processes, args.seed)]
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f: f.write(text)
+    else:
+        print(text)
+    mismatches = sum([result["mismatches"] for result in report.get("differential", [])])
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,80 @@
+import time
+import multiprocessing
+from argparse import ArgumentParser
+
+from pypokerengine.engine.card import Card
+from pypokerengine.utils.card_utils import simulate_hole_card_win_rate
+from pypokerengine.utils.flop_equity_utils import TABLE_FILE, gen_canonical_ids, gen_canonical_flops, gen_canonical_spots,\
+        save_flop_equity_table
+from pypokerengine.utils.range_equity_utils import COMBO_IDS, calc_combo_results
+from pypokerengine.utils.rng_utils import spawn_rng
+
+""" Example---To generate the exact heads-up flop equity table on every core.
+
+$ python gen_flop_equity_table.py -n 0
+
+Exact generation enumerates the 1,176 turn and river cards of each of the 1,755 canonical
+flops once, and scores all 1,326 hole cards on every runout at the same time (about 1.3
+seconds per flop, 40 core minutes in total). For an approximate table, simulate each
+spot instead. Each spot is simulated from its own stream of the seed, so the table does
+not depend on the number of processes.
+
+$ python gen_flop_equity_table.py -n 2000 -s 0
+"""
+
+CHUNK_SIZE = 1000
+
+
+# Exact win rate of every canonical spot on the flop. Spots which several hole
+# cards of the flop map to get the same win rate from each of them.
+def calc_flop(flop_ids):
+    flop = [Card.from_id(card_id) for card_id in flop_ids]
+    results = calc_combo_results(flop, nb_board=len(COMBO_IDS))
+    win_rates = {}
+    for combo, (win, tie, lose) in zip(COMBO_IDS, results):
+        hole_card = [Card.from_id(int(card_id)) for card_id in combo]
+        if any([card in flop for card in hole_card]): continue
+        win_rates[gen_canonical_ids(hole_card, flop)] = float((win + tie) / (win + tie + lose))
+    return list(win_rates.items())
+
+
+def calc_chunk(args):
+    spots, nb_simulation, seed = args
+    win_rates = []
+    for hole_ids, flop_ids in spots:
+        hole_card, flop = [Card.from_id(i) for i in hole_ids], [Card.from_id(i) for i in flop_ids]
+        rng = spawn_rng(seed, hole_ids, flop_ids)
+        win_rates.append(simulate_hole_card_win_rate(nb_simulation, 2, hole_card, flop, seed=rng))
+    return win_rates
+
+
+def gen_table(nb_simulation, processes, seed):
+    pool = multiprocessing.Pool(processes)
+    try:
+        if nb_simulation == 0:
+            entries = dict([entry for flop_entries in pool.imap(calc_flop, gen_canonical_flops()) for entry in flop_entries])
+            return sorted(entries.items())
+        spots = gen_canonical_spots()
+        jobs = [(spots[start:start + CHUNK_SIZE], nb_simulation, seed) for start in range(0, len(spots), CHUNK_SIZE)]
+        win_rates = [win_rate for chunk in pool.imap(calc_chunk, jobs) for win_rate in chunk]
+    finally:
+        pool.close()
+        pool.join()
+    return list(zip(spots, win_rates))
+
+
+def parse_arguments():
+    parser = ArgumentParser()
+    parser.add_argument('-n', '--nb_simulation', help="Simulations per spot (0 to enumerate exactly)", default=0, type=int)
+    parser.add_argument('-p', '--processes', help="Worker processes", default=multiprocessing.cpu_count(), type=int)
+    parser.add_argument('-s', '--seed', help="Random seed", default=0, type=int)
+    parser.add_argument('-o', '--output', help="Path of the table file", default=TABLE_FILE, type=str)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    start = time.time()
+    entries = gen_table(args.nb_simulation, args.processes, args.seed)
+    save_flop_equity_table(entries, args.nb_simulation, args.output)
+    print("Wrote flop equity table of {} spots to {} in {:.1f} seconds".format(len(entries), args.output, time.time() - start))
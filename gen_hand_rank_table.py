@@ -0,0 +1,21 @@
+from argparse import ArgumentParser
+
+from pypokerengine.engine.hand_evaluator import HandRankTable
+
+""" Example---To write the hand rank table next to hand_evaluator.py, where it is loaded from.
+
+$ python gen_hand_rank_table.py
+"""
+
+
+def parse_arguments():
+    parser = ArgumentParser()
+    parser.add_argument('-o', '--output', help="Path of the table file", default=HandRankTable.TABLE_FILE, type=str)
+    args = parser.parse_args()
+    return args.output
+
+
+if __name__ == '__main__':
+    output = parse_arguments()
+    HandRankTable.save(output)
+    print("Wrote hand rank table (version {}) to {}".format(HandRankTable.TABLE_VERSION, output))
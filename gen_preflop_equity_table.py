@@ -0,0 +1,66 @@
+import os
+import time
+import multiprocessing
+from argparse import ArgumentParser
+
+from pypokerengine.utils.card_utils import simulate_hole_card_win_rate
+from pypokerengine.utils.preflop_equity_utils import MAX_OPPONENT_NUM, gen_all_hand_classes, gen_class_hole_card
+from pypokerengine.utils.rng_utils import spawn_rng
+from pypokerengine.utils.file_utils import write_atomically
+
+""" Example---To regenerate the shipped preflop equity table with 200000 simulations per entry on every core.
+
+$ python gen_preflop_equity_table.py -n 200000 -s 0
+
+Each (hand class, number of opponents) entry is simulated from its own stream of the seed,
+so the table does not depend on the number of processes.
+"""
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pypokerengine", "utils", "preflop_equity_table.py")
+
+
+def simulate_entry(args):
+    hand_class, opponent_num, nb_simulation, seed = args
+    rng = spawn_rng(seed, hand_class, opponent_num)
+    return simulate_hole_card_win_rate(nb_simulation, opponent_num + 1, gen_class_hole_card(hand_class), seed=rng)
+
+
+def gen_table(nb_simulation, processes, seed):
+    hand_classes = gen_all_hand_classes()
+    jobs = [(hand_class, opponent_num, nb_simulation, seed)
+            for hand_class in hand_classes for opponent_num in range(1, MAX_OPPONENT_NUM + 1)]
+    pool = multiprocessing.Pool(processes)
+    try:
+        win_rates = pool.map(simulate_entry, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return [(hand_class, win_rates[i * MAX_OPPONENT_NUM:(i + 1) * MAX_OPPONENT_NUM]) for i, hand_class in enumerate(hand_classes)]
+
+
+def write_table(path, table, nb_simulation, seed):
+    lines = [
+            "# Generated by gen_preflop_equity_table.py (%d simulations per entry, seed %d). Do not edit." % (nb_simulation, seed),
+            "# hand class => win rate against 1 to %d random opponents" % MAX_OPPONENT_NUM,
+            "PREFLOP_WIN_RATE = {"
+            ]
+    lines += ['    "%s": (%s),' % (hand_class, ", ".join(["%.4f" % rate for rate in rates])) for hand_class, rates in table]
+    lines += ["}", ""]
+    write_atomically(path, "\n".join(lines), binary=False)
+
+
+def parse_arguments():
+    parser = ArgumentParser()
+    parser.add_argument('-n', '--nb_simulation', help="Simulations per entry", default=200000, type=int)
+    parser.add_argument('-p', '--processes', help="Worker processes", default=multiprocessing.cpu_count(), type=int)
+    parser.add_argument('-s', '--seed', help="Random seed", default=0, type=int)
+    parser.add_argument('-o', '--output', help="Path of the table module", default=TABLE_FILE, type=str)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    start = time.time()
+    table = gen_table(args.nb_simulation, args.processes, args.seed)
+    write_table(args.output, table, args.nb_simulation, args.seed)
+    print("Wrote preflop equity table of {} hand classes to {} in {:.1f} seconds".format(len(table), args.output, time.time() - start))
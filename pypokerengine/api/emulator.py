@@ -12,13 +12,17 @@ from pypokerengine.engine.message_builder import MessageBuilder
 from pypokerengine.players import BasePokerPlayer
 from pypokerengine.utils.game_state_utils import deepcopy_game_state
 from pypokerengine.utils.timeout_decorator import timeout2
+from pypokerengine.utils.rng_utils import gen_rng, spawn_rng
 
 class Emulator(object):
 
-    def __init__(self):
+    # seed : int or random object. Each generated game gets its own deck stream.
+    def __init__(self, seed=None):
         self.game_rule = {}
         self.blind_structure = {}
         self.players_holder = {}
+        self.seed = seed
+        self.rng = None if seed is None else gen_rng(seed)
 
     def set_game_rule(self, player_num, max_round, small_blind_amount, ante_amount):
         self.game_rule["player_num"] = player_num
@@ -43,7 +47,7 @@ class Emulator(object):
         return self.players_holder[uuid]
 
     def generate_initial_game_state(self, players_info):
-        table = Table()
+        table = Table(seed=spawn_rng(self.rng) if self.seed is not None else None)
         for uuid, info in players_info.items():
             table.seats.sitdown(Player(uuid, info["stack"], info["name"]))
 
@@ -118,6 +122,9 @@ class Emulator(object):
         ante, sb_amount = self.game_rule["ante"], self.game_rule["sb_amount"]
         deepcopy = deepcopy_game_state(game_state)
         deepcopy_table = deepcopy["table"]
+        # next round goes on with the deck stream and the deal schedule
+        deepcopy_table.deck.rng = game_state["table"].deck.rng
+        deepcopy_table.deck.schedule = game_state["table"].deck.schedule
         deepcopy_table.shift_dealer_btn()
 
         ante, sb_amount = update_blind_level(ante, sb_amount, round_count, self.blind_structure)
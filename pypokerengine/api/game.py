@@ -1,13 +1,19 @@
 from pypokerengine.engine.dealer import Dealer
 from pypokerengine.players import BasePokerPlayer
 from pypokerengine.utils.timeout_decorator import timeout2
+from pypokerengine.utils.rng_utils import spawn_rng
 
-def setup_config(max_round, initial_stack, small_blind_amount, ante=0):
-    return Config(max_round, initial_stack, small_blind_amount, ante)
+# seed : int or random object. Each start_poker call with the config plays
+#        the next game of the match on its own stream spawn_rng(seed, i).
+def setup_config(max_round, initial_stack, small_blind_amount, ante=0, seed=None):
+    return Config(max_round, initial_stack, small_blind_amount, ante, seed)
 
-def start_poker(config, verbose=2):
+# seed       : overrides the stream of this game (e.g. spawn_rng(seed, i) to replay game i)
+# cheat_deck : deck dealt instead of a shuffled one (e.g. a deck of a deal schedule)
+def start_poker(config, verbose=2, seed=None, cheat_deck=None):
     config.validation()
-    dealer = Dealer(config.sb_amount, config.initial_stack, config.ante)
+    game_seed = config.next_game_seed() if seed is None else seed
+    dealer = Dealer(config.sb_amount, config.initial_stack, config.ante, game_seed, cheat_deck)
     dealer.set_verbose(verbose)
     dealer.set_blind_structure(config.blind_structure)
     for info in config.players_info:
@@ -24,13 +30,15 @@ def _format_result(result_message):
 
 class Config(object):
 
-    def __init__(self, max_round, initial_stack, sb_amount, ante):
+    def __init__(self, max_round, initial_stack, sb_amount, ante, seed=None):
         self.players_info = []
         self.blind_structure = {}
         self.max_round = max_round
         self.initial_stack = initial_stack
         self.sb_amount = sb_amount
         self.ante = ante
+        self.seed = seed
+        self.game_count = 0
 
     def register_player(self, name, algorithm):
         if not isinstance(algorithm, BasePokerPlayer):
@@ -46,6 +54,11 @@ class Config(object):
     def set_blind_structure(self, blind_structure):
         self.blind_structure = blind_structure
 
+    def next_game_seed(self):
+        game_seed = None if self.seed is None else spawn_rng(self.seed, self.game_count)
+        self.game_count += 1
+        return game_seed
+
     def validation(self):
         player_num = len(self.players_info)
         if player_num < 2:
@@ -1,4 +1,4 @@
-class Card:
+class Card(object):
 
   CLUB = 2
   DIAMOND = 4
@@ -29,42 +29,59 @@ class Card:
   }
 
 
-  def __init__(self, suit, rank):
-    self.suit = suit
-    self.rank = 14 if rank == 1 else rank
+  # All 52 cards are created once (see the end of this file) and shared, so
+  # cards are immutable and compared by identity.
+  __slots__ = ["suit", "rank", "_Card__id", "_Card__str"]
 
-  def __eq__(self, other):
-    return self.suit == other.suit and self.rank == other.rank
+  def __new__(cls, suit, rank):
+    rank = 14 if rank == 1 else rank
+    card = cls.__by_suit_rank.get((suit, rank))
+    if card is None:
+      raise ValueError("Invalid card [suit = %s, rank = %s]" % (suit, rank))
+    return card
+
+  def __setattr__(self, name, value):
+    raise AttributeError("Card is immutable")
+
+  def __reduce__(self):
+    return (Card, (self.suit, self.rank))
+
+  def __copy__(self):
+    return self
+
+  def __deepcopy__(self, memo):
+    return self
 
   def __str__(self):
-    suit = self.SUIT_MAP[self.suit]
-    rank = self.RANK_MAP[self.rank]
-    return "{0}{1}".format(suit, rank)
+    return self.__str
 
   def to_id(self):
-    rank = 1 if self.rank == 14 else self.rank
-    num = 0
-    tmp = self.suit >> 1
-    while tmp&1 != 1:
-      num += 1
-      tmp >>= 1
-
-    return rank + 13 * num
+    return self.__id
 
   @classmethod
   def from_id(cls, card_id):
-    suit, rank = 2, card_id
-    while rank > 13:
-      suit <<= 1
-      rank -= 13
-
-    return cls(suit, rank)
+    return cls.__by_id[card_id]
 
   @classmethod
   def from_str(cls, str_card):
     assert(len(str_card)==2)
-    inverse = lambda hsh: {v:k for k,v in hsh.items()}
-    suit = inverse(cls.SUIT_MAP)[str_card[0].upper()]
-    rank = inverse(cls.RANK_MAP)[str_card[1]]
-    return cls(suit, rank)
+    return cls.__by_str[str_card[0].upper() + str_card[1]]
+
+  __by_suit_rank = {}
+  __by_id = [None]
+  __by_str = {}
+
+  @classmethod
+  def _setup_cards(cls):
+    for num, suit in enumerate(sorted(cls.SUIT_MAP.keys())):
+      for rank in range(1, 14):
+        card = object.__new__(cls)
+        object.__setattr__(card, "rank", 14 if rank == 1 else rank)
+        object.__setattr__(card, "suit", suit)
+        object.__setattr__(card, "_Card__id", rank + 13 * num)
+        object.__setattr__(card, "_Card__str", cls.SUIT_MAP[suit] + cls.RANK_MAP[card.rank])
+        cls.__by_suit_rank[(card.suit, card.rank)] = card
+        cls.__by_id.append(card)
+        cls.__by_str[str(card)] = card
 
+Card._setup_cards()
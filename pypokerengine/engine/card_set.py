@@ -0,0 +1,81 @@
+from pypokerengine.engine.card import Card
+
+class CardSet(object):
+
+  # Set of cards kept in one integer. Card of id i is the bit 1 << (i - 1).
+  __slots__ = ["mask"]
+
+  FULL_MASK = (1 << 52) - 1
+
+  def __init__(self, cards=None, mask=0):
+    for card in cards or []:
+      mask |= 1 << (card.to_id() - 1)
+    object.__setattr__(self, "mask", mask)
+
+  def __setattr__(self, name, value):
+    raise AttributeError("CardSet is immutable")
+
+  @classmethod
+  def full(cls):
+    return cls(mask=cls.FULL_MASK)
+
+  @classmethod
+  def from_ids(cls, card_ids):
+    mask = 0
+    for card_id in card_ids: mask |= 1 << (card_id - 1)
+    return cls(mask=mask)
+
+  def union(self, other):
+    return CardSet(mask=self.mask | self.__mask_of(other))
+
+  def difference(self, other):
+    return CardSet(mask=self.mask & ~self.__mask_of(other))
+
+  def intersection(self, other):
+    return CardSet(mask=self.mask & self.__mask_of(other))
+
+  __or__ = union
+  __sub__ = difference
+  __and__ = intersection
+
+  def complement(self):
+    return CardSet(mask=self.FULL_MASK & ~self.mask)
+
+  def add(self, card):
+    return CardSet(mask=self.mask | 1 << (card.to_id() - 1))
+
+  def __contains__(self, card):
+    return self.mask >> (card.to_id() - 1) & 1 == 1
+
+  def __len__(self):
+    return bin(self.mask).count("1")
+
+  def __iter__(self):
+    return (Card.from_id(card_id) for card_id in self.to_ids())
+
+  def to_ids(self):
+    ids, mask = [], self.mask
+    while mask:
+      low_bit = mask & -mask
+      ids.append(low_bit.bit_length())
+      mask ^= low_bit
+    return ids
+
+  def __eq__(self, other):
+    return isinstance(other, CardSet) and self.mask == other.mask
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash(self.mask)
+
+  def __str__(self):
+    return "CardSet(%s)" % ", ".join([str(card) for card in self])
+
+  __repr__ = __str__
+
+  # accept CardSet or list of cards as the other operand
+  @classmethod
+  def __mask_of(cls, cards):
+    return cards.mask if isinstance(cards, CardSet) else cls(cards).mask
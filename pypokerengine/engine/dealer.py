@@ -1,4 +1,3 @@
-import random
 import pprint
 from collections import OrderedDict
 
@@ -7,17 +6,20 @@ from pypokerengine.engine.table import Table
 from pypokerengine.engine.player import Player
 from pypokerengine.engine.round_manager import RoundManager
 from pypokerengine.engine.message_builder import MessageBuilder
+from pypokerengine.utils.rng_utils import gen_rng, spawn_rng
 
 class Dealer:
 
-  def __init__(self, small_blind_amount=None, initial_stack=None, ante=None):
+  def __init__(self, small_blind_amount=None, initial_stack=None, ante=None, seed=None, cheat_deck=None):
     self.small_blind_amount = small_blind_amount
     self.ante = ante if ante else 0
     self.initial_stack = initial_stack
+    self.rng = None if seed is None else gen_rng(seed)
     self.uuid_list = self.__generate_uuid_list()
     self.message_handler = MessageHandler()
     self.message_summarizer = MessageSummarizer(verbose=0)
-    self.table = Table()
+    # the deck gets its own stream so that uuid generation does not shift the cards
+    self.table = Table(cheat_deck=cheat_deck, seed=spawn_rng(self.rng) if seed is not None else None)
     self.blind_structure = {}
 
   def register_player(self, player_name, algorithm):
@@ -200,7 +202,7 @@ class Dealer:
   def __generate_uuid(self):
     uuid_size = 22
     chars = [chr(code) for code in range(97,123)]
-    return "".join([random.choice(chars) for _ in range(uuid_size)])
+    return "".join([gen_rng(self.rng).choice(chars) for _ in range(uuid_size)])
 
 class MessageHandler:
 
@@ -1,47 +1,93 @@
-from functools import reduce
-
 from pypokerengine.engine.card import Card
-import random
+from pypokerengine.engine.card_set import CardSet
+from pypokerengine.utils.rng_utils import gen_rng
 
-class Deck:
+class Deck(object):
 
-  def __init__(self, deck_ids=None, cheat=False, cheat_card_ids=[]):
+  # schedule : iterator of the card ids dealt in each round (in draw order).
+  #            Every restore deals the next round of it, and shuffle does nothing.
+  def __init__(self, deck_ids=None, cheat=False, cheat_card_ids=[], seed=None, schedule=None):
     self.cheat = cheat
     self.cheat_card_ids = cheat_card_ids
-    self.deck = [Card.from_id(cid) for cid in deck_ids] if deck_ids else self.__setup()
+    # None draws from the global random module (and keeps the deck picklable)
+    self.rng = None if seed is None else gen_rng(seed)
+    self.schedule = schedule
+    # Card ids of the deck in a fixed buffer. Cards are drawn from the end,
+    # and __size is the position of the next card to draw plus one.
+    self.__ids = bytearray(52)
+    self.__size = 0
+    if deck_ids is not None:
+      self.__set_ids(deck_ids)
+    else:
+      self.restore()
+
+  @property
+  def deck(self):
+    return [Card.from_id(card_id) for card_id in self.__ids[:self.__size]]
+
+  @deck.setter
+  def deck(self, cards):
+    self.__set_ids([card.to_id() for card in cards])
 
   def draw_card(self):
-    return self.deck.pop()
+    if self.__size == 0: raise IndexError(self.__empty_deck_msg)
+    self.__size -= 1
+    return Card.from_id(self.__ids[self.__size])
 
   def draw_cards(self, num):
-    return reduce(lambda acc, _: acc + [self.draw_card()], range(num), [])
+    start = self.__size - num
+    if start < 0: raise IndexError(self.__empty_deck_msg)
+    drawn = self.__ids[start:self.__size]
+    self.__size = start
+    return [Card.from_id(card_id) for card_id in reversed(drawn)]
 
   def size(self):
-    return len(self.deck)
+    return self.__size
+
+  def card_set(self):
+    return CardSet.from_ids(self.__ids[:self.__size])
 
   def restore(self):
-    self.deck = self.__setup()
+    self.__set_ids(self.__initial_ids())
 
-  def shuffle(self):
-    if not self.cheat:
-      random.shuffle(self.deck)
+  # Shuffle only the next num cards to draw (all cards if num is None).
+  # The top num cards are a uniformly random draw of the whole deck, which
+  # is all a round needs when it deals at most num cards.
+  def shuffle(self, num=None):
+    if self.cheat or self.schedule is not None: return
+    ids, size, rand = self.__ids, self.__size, gen_rng(self.rng).random
+    num = size if num is None else min(num, size)
+    for i in range(size - 1, size - 1 - num, -1):
+      j = int(rand() * (i + 1))
+      ids[i], ids[j] = ids[j], ids[i]
 
-  # serialize format : [cheat_flg, chat_card_ids, deck_card_ids]
+  # serialize format : [cheat_flg, chat_card_ids, deck_card_ids(bytes)]
   def serialize(self):
-    return [self.cheat, self.cheat_card_ids, [card.to_id() for card in self.deck]]
+    return [self.cheat, self.cheat_card_ids, bytes(self.__ids[:self.__size])]
 
+  # The rng and the schedule are not part of the serial. Pass the ones of the
+  # original deck to go on with them (the deck shuffles with the global random
+  # module otherwise).
   @classmethod
-  def deserialize(self, serial):
+  def deserialize(self, serial, rng=None, schedule=None):
     cheat, cheat_card_ids, deck_ids = serial
-    return self(deck_ids=deck_ids, cheat=cheat, cheat_card_ids=cheat_card_ids)
+    return self(deck_ids=bytearray(deck_ids), cheat=cheat, cheat_card_ids=cheat_card_ids, seed=rng, schedule=schedule)
 
-  def __setup(self):
-    return self.__setup_cheat_deck() if self.cheat else self.__setup_52_cards()
+  __empty_deck_msg = "No card is left in the deck"
+  __52_card_ids = bytearray(range(1, 53))
 
-  def __setup_52_cards(self):
-    return [Card.from_id(cid) for cid in range(1,53)]
+  def __set_ids(self, deck_ids):
+    self.__size = len(deck_ids)
+    self.__ids[:self.__size] = bytearray(deck_ids)
 
-  def __setup_cheat_deck(self):
-    cards = [Card.from_id(cid) for cid in self.cheat_card_ids]
-    return cards[::-1]
+  def __initial_ids(self):
+    if self.schedule is not None: return self.__scheduled_ids()
+    return bytearray(self.cheat_card_ids[::-1]) if self.cheat else self.__52_card_ids
 
+  # the scheduled cards are drawn first and the rest of the deck follows them
+  # (an exhausted schedule leaves the deck empty)
+  def __scheduled_ids(self):
+    dealt_ids = bytearray(next(self.schedule, b""))
+    if not dealt_ids: return dealt_ids
+    rest_ids = (CardSet.full() - CardSet.from_ids(dealt_ids)).to_ids()
+    return bytearray(rest_ids) + dealt_ids[::-1]
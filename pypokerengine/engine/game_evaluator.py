@@ -38,7 +38,8 @@ class GameEvaluator:
 
   @classmethod
   def __find_winners_from(self, community_card, players):
-    score_player = lambda player: HandEvaluator.eval_hand(player.hole_card, community_card)
+    board_state = HandEvaluator.gen_board_state(community_card)
+    score_player = lambda player: HandEvaluator.eval_hand_on_board(player.hole_card, board_state)
 
     active_players = [player for player in players if player.is_active()]
     scores = [score_player(player) for player in active_players]
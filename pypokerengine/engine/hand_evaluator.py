@@ -1,5 +1,10 @@
-from functools import reduce
-from itertools import groupby
+import os
+import struct
+from array import array
+from itertools import combinations_with_replacement
+
+from pypokerengine.engine.card import Card
+from pypokerengine.utils.file_utils import write_atomically, map_file, view_arrays, calc_arrays_size
 
 class HandEvaluator:
 
@@ -28,8 +33,7 @@ class HandEvaluator:
   @classmethod
   def gen_hand_rank_info(self, hole, community):
     hand = self.eval_hand(hole, community)
-    row_strength = self.__mask_hand_strength(hand)
-    strength = self.HAND_STRENGTH_MAP[row_strength]
+    strength = self.get_hand_strength(hand)
     hand_high = self.__mask_hand_high_rank(hand)
     hand_low = self.__mask_hand_low_rank(hand)
     hole_high = self.__mask_hole_high_rank(hand)
@@ -48,12 +52,72 @@ class HandEvaluator:
         "card": [str(card) for card in hole]
     }
 
+  # TABLE_MODE   : look 5-7 cards up in HandRankTable (fast, ~22MB of tables)
+  # BITMASK_MODE : evaluate rank masks with RankMaskTable (8192 entry tables)
+  TABLE_MODE = "table"
+  BITMASK_MODE = "bitmask"
+
+  @classmethod
+  def set_mode(self, mode):
+    if mode not in [self.TABLE_MODE, self.BITMASK_MODE]:
+      raise ValueError("Unknown evaluator mode [mode = %s]" % mode)
+    if mode == self.TABLE_MODE and HandRankTable.RANK_TABLE is None:
+      HandRankTable.setup()
+    self.__mode = mode
+
+  @classmethod
+  def get_mode(self):
+    return self.__mode
+
+  # Name of the made hand in eval_hand result (ex. "TWOPAIR"). With 3 or 4
+  # community cards it tells the best 5 card hand made on the flop or turn.
+  @classmethod
+  def get_hand_strength(self, hand):
+    return self.HAND_STRENGTH_MAP[self.__mask_hand_strength(hand)]
+
   @classmethod
   def eval_hand(self, hole, community):
+    return self.eval_hand_on_board(hole, self.gen_board_state(community))
+
+  # Precompute the community card part of the evaluation so that it can be
+  # shared by every hole card evaluated on the same board.
+  @classmethod
+  def gen_board_state(self, community):
+    return HandRankTable.gen_board_state(community)
+
+  @classmethod
+  def eval_hand_on_board(self, hole, board_state):
     ranks = sorted([card.rank for card in hole])
     hole_flg = ranks[1] << 4 | ranks[0]
-    hand_flg = self.__calc_hand_info_flg(hole, community) << 8
-    return hand_flg | hole_flg
+    card_num = len(hole) + len(board_state["community"])
+    if self.__mode == self.TABLE_MODE and card_num in HandRankTable.CARD_NUM_OFFSETS:
+      hand_flg = HandRankTable.lookup_on_board(hole, board_state)
+    else:
+      suit_masks = dict(board_state["suit_masks"])
+      for card in hole: suit_masks[card.suit] |= 1 << (card.rank - 2)
+      hand_flg = self.__calc_hand_info_flg(suit_masks.values())
+    return (hand_flg or hole_flg) << 8 | hole_flg
+
+  # hole_ids      : (N, 2) array of card ids
+  # community_ids : (N, M) or (1, M) array of card ids (M = 3, 4 or 5)
+  # Return (N,) array of eval_hand results
+  # Whatever the mode, this looks the hands up in HandRankTable, so the first
+  # call loads (or builds) the full tables even in BITMASK_MODE.
+  @classmethod
+  def eval_hand_batch(self, hole_ids, community_ids):
+    import numpy as np
+    hole_ids = np.asarray(hole_ids, dtype=np.intp)
+    community_ids = np.asarray(community_ids, dtype=np.intp)
+    if hole_ids.ndim != 2 or hole_ids.shape[1] != 2:
+      raise ValueError("hole_ids must be (N, 2) array but was %s" % (hole_ids.shape,))
+    if community_ids.ndim != 2 or not 3 <= community_ids.shape[1] <= 5:
+      raise ValueError("community_ids must be (N, 3-5) or (1, 3-5) array but was %s" % (community_ids.shape,))
+    community_ids = np.broadcast_to(community_ids, (len(hole_ids), community_ids.shape[1]))
+    hand_flg = HandRankTable.lookup_batch(np.concatenate([hole_ids, community_ids], axis=1))
+    ranks = HandRankTable.batch_tables()["rank"][hole_ids]
+    hole_flg = ranks.max(axis=1) << 4 | ranks.min(axis=1)
+    hand_flg = np.where(hand_flg == 0, hole_flg, hand_flg)
+    return hand_flg << 8 | hole_flg
 
   # Return Format
   # [Bit flg of hand][rank1(4bit)][rank2(4bit)]
@@ -68,171 +132,10 @@ class HandEvaluator:
   #       FourCard of rank 2       =>  1000000 0010 0000
   #       straight flash of rank 7 => 10000000 0111 0000
   @classmethod
-  def __calc_hand_info_flg(self, hole, community):
-    cards = hole + community
-    if self.__is_straightflash(cards): return self.STRAIGHTFLASH | self.__eval_straightflash(cards)
-    if self.__is_fourcard(cards): return self.FOURCARD | self.__eval_fourcard(cards)
-    if self.__is_fullhouse(cards): return self.FULLHOUSE | self.__eval_fullhouse(cards)
-    if self.__is_flash(cards): return self.FLASH | self.__eval_flash(cards)
-    if self.__is_straight(cards): return self.STRAIGHT | self.__eval_straight(cards)
-    if self.__is_threecard(cards): return self.THREECARD | self.__eval_threecard(cards)
-    if self.__is_twopair(cards): return self.TWOPAIR | self.__eval_twopair(cards)
-    if self.__is_onepair(cards): return self.ONEPAIR | (self.__eval_onepair(cards))
-    return self.__eval_holecard(hole)
-
-  @classmethod
-  def __eval_holecard(self, hole):
-    ranks = sorted([card.rank for card in hole])
-    return ranks[1] << 4 | ranks[0]
-
-  @classmethod
-  def __is_onepair(self, cards):
-    return self.__eval_onepair(cards) != 0
-
-  @classmethod
-  def __eval_onepair(self, cards):
-    rank = 0
-    memo = 0  # bit memo
-    for card in cards:
-      mask = 1 << card.rank
-      if memo & mask != 0: rank = max(rank, card.rank)
-      memo |= mask
-    return rank << 4
-
-  @classmethod
-  def __is_twopair(self, cards):
-    return len(self.__search_twopair(cards)) == 2
-
-  @classmethod
-  def __eval_twopair(self, cards):
-    ranks = self.__search_twopair(cards)
-    return ranks[0] << 4 | ranks[1]
-
-  @classmethod
-  def __search_twopair(self, cards):
-    ranks = []
-    memo = 0
-    for card in cards:
-      mask = 1 << card.rank
-      if memo & mask != 0: ranks.append(card.rank)
-      memo |= mask
-    return sorted(ranks)[::-1][:2]
-
-  @classmethod
-  def __is_threecard(self, cards):
-    return self.__search_threecard(cards) != -1
-
-  @classmethod
-  def __eval_threecard(self, cards):
-    return self.__search_threecard(cards) << 4
-
-  @classmethod
-  def __search_threecard(self, cards):
-    rank = -1
-    bit_memo = reduce(lambda memo,card: memo + (1 << (card.rank-1)*3), cards, 0)
-    for r in range(2, 15):
-      bit_memo >>= 3
-      count = bit_memo & 7
-      if count >= 3: rank = r
-    return rank
-
-  @classmethod
-  def __is_straight(self, cards):
-    return self.__search_straight(cards) != -1
-
-  @classmethod
-  def __eval_straight(self, cards):
-    return self.__search_straight(cards) << 4
+  def __calc_hand_info_flg(self, suit_masks):
+    return RankMaskTable.eval_suit_masks(suit_masks)
 
-  @classmethod
-  def __search_straight(self, cards):
-    bit_memo = reduce(lambda memo, card: memo | 1 << card.rank, cards, 0)
-    rank = -1
-    straight_check = lambda acc, i: acc & (bit_memo >> (r+i) & 1) == 1
-    for r in range(2, 15):
-      if reduce(straight_check, range(5), True): rank = r
-    return rank
-
-  @classmethod
-  def __is_flash(self, cards):
-    return self.__search_flash(cards) != -1
-
-  @classmethod
-  def __eval_flash(self, cards):
-    return self.__search_flash(cards) << 4
-
-  @classmethod
-  def __search_flash(self, cards):
-    best_suit_rank = -1
-    fetch_suit = lambda card: card.suit
-    fetch_rank = lambda card: card.rank
-    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
-      g = list(group_obj)
-      if len(g) >= 5:
-        max_rank_card = max(g, key=fetch_rank)
-        best_suit_rank = max(best_suit_rank, max_rank_card.rank)
-    return best_suit_rank
-
-  @classmethod
-  def __is_fullhouse(self, cards):
-    r1, r2 = self.__search_fullhouse(cards)
-    return r1 and r2
-
-  @classmethod
-  def __eval_fullhouse(self, cards):
-    r1, r2 = self.__search_fullhouse(cards)
-    return r1 << 4 | r2
-
-  @classmethod
-  def __search_fullhouse(self, cards):
-    fetch_rank = lambda card: card.rank
-    three_card_ranks, two_pair_ranks = [], []
-    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
-      g = list(group_obj)
-      if len(g) >= 3:
-        three_card_ranks.append(rank)
-      if len(g) >= 2:
-        two_pair_ranks.append(rank)
-    two_pair_ranks = [rank for rank in two_pair_ranks if not rank in three_card_ranks]
-    if len(three_card_ranks) == 2:
-      two_pair_ranks.append(min(three_card_ranks))
-    max_ = lambda l: None if len(l)==0 else max(l)
-    return max_(three_card_ranks), max_(two_pair_ranks)
-
-  @classmethod
-  def __is_fourcard(self, cards):
-    return self.__eval_fourcard(cards) != 0
-
-  @classmethod
-  def __eval_fourcard(self, cards):
-    rank = self.__search_fourcard(cards)
-    return rank << 4
-
-  @classmethod
-  def __search_fourcard(self, cards):
-    fetch_rank = lambda card: card.rank
-    for rank, group_obj in groupby(sorted(cards, key=fetch_rank), key=fetch_rank):
-      g = list(group_obj)
-      if len(g) >= 4:
-        return rank
-    return 0
-
-  @classmethod
-  def __is_straightflash(self, cards):
-    return self.__search_straightflash(cards) != -1
-
-  @classmethod
-  def __eval_straightflash(self, cards):
-    return self.__search_straightflash(cards) << 4
-
-  @classmethod
-  def __search_straightflash(self, cards):
-    flash_cards = []
-    fetch_suit = lambda card: card.suit
-    for suit, group_obj in groupby(sorted(cards, key=fetch_suit), key=fetch_suit):
-      g = list(group_obj)
-      if len(g) >= 5: flash_cards = g
-    return self.__search_straight(flash_cards)
+  __mode = TABLE_MODE
 
   @classmethod
   def __mask_hand_strength(self, bit):
@@ -258,3 +161,243 @@ class HandEvaluator:
   def __mask_hole_low_rank(self, bit):
     mask = 15
     return bit & mask
+
+
+class RankMaskTable:
+
+  # Tables indexed by 13 bit rank mask (rank r is bit 1 << (r - 2))
+  # POPCOUNT_TABLE[mask] => number of ranks in the mask
+  # TOP_RANK_TABLE[mask] => highest rank in the mask (0 if empty)
+  # STRAIGHT_TABLE[mask] => lowest rank of the highest straight (0 if none)
+  POPCOUNT_TABLE = None
+  TOP_RANK_TABLE = None
+  STRAIGHT_TABLE = None
+
+  # suit_masks : rank mask of each suit
+  # Return hand flg in HandEvaluator format (0 means HIGHCARD)
+  @classmethod
+  def eval_suit_masks(self, suit_masks):
+    popcount, top, straight = self.POPCOUNT_TABLE, self.TOP_RANK_TABLE, self.STRAIGHT_TABLE
+    c, d, h, s = suit_masks
+    flash = 0
+    for mask in suit_masks:
+      if popcount[mask] >= 5:
+        if straight[mask]: return HandEvaluator.STRAIGHTFLASH | straight[mask] << 4
+        flash = HandEvaluator.FLASH | top[mask] << 4
+    fourcards = c & d & h & s
+    if fourcards: return HandEvaluator.FOURCARD | top[fourcards] << 4
+    threecards = (c & d & h) | (c & d & s) | (c & h & s) | (d & h & s)
+    pairs = (c & d) | (c & h) | (c & s) | (d & h) | (d & s) | (h & s)
+    if threecards:
+      three = top[threecards]
+      two = top[pairs & ~(1 << (three - 2))]
+      if two: return HandEvaluator.FULLHOUSE | three << 4 | two
+    if flash: return flash
+    ranks = c | d | h | s
+    if straight[ranks]: return HandEvaluator.STRAIGHT | straight[ranks] << 4
+    if threecards: return HandEvaluator.THREECARD | three << 4
+    if popcount[pairs] >= 2:
+      high = top[pairs]
+      return HandEvaluator.TWOPAIR | high << 4 | top[pairs & ~(1 << (high - 2))]
+    if pairs: return HandEvaluator.ONEPAIR | top[pairs] << 4
+    return HandEvaluator.HIGHCARD
+
+  @classmethod
+  def setup(self):
+    masks = range(1 << 13)
+    self.POPCOUNT_TABLE = array('B', [bin(mask).count("1") for mask in masks])
+    self.TOP_RANK_TABLE = array('B', [mask.bit_length() + 1 if mask else 0 for mask in masks])
+    self.STRAIGHT_TABLE = array('B', [self.__search_straight(mask) for mask in masks])
+
+  @classmethod
+  def __search_straight(self, mask):
+    for low in range(10, 1, -1):
+      straight = 31 << (low - 2)
+      if mask & straight == straight: return low
+    return 0
+
+
+class HandRankTable:
+
+  # Additive key of each rank (index = rank - 2). The sum of the keys of
+  # any N ranks (each rank used at most 4 times) is unique among N cards, so
+  # the sum plus the offset of N directly indexes RANK_TABLE. The offsets
+  # move the keys of 5 and 6 cards to slots which no 7 card key uses.
+  RANK_KEYS = [0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181]
+  CARD_NUM_OFFSETS = { 5: 4258040, 6: 3262558, 7: 0 }
+
+  # Each suit counts in its own 3 bit field of the suit key
+  SUIT_KEYS = { 2: 1, 4: 1 << 3, 8: 1 << 6, 16: 1 << 9 }
+
+  # RANK_TABLE[rank key]          => hand flg of the 5-7 cards ignoring suits
+  #                                 (0 means HIGHCARD)
+  # FLASH_TABLE[13 bit rank mask] => hand flg of the cards of flash suit
+  # FLASH_SUIT_TABLE[suit key]    => suit which has 5 or more cards (0 if none)
+  RANK_TABLE = None
+  FLASH_TABLE = None
+  FLASH_SUIT_TABLE = None
+
+  # Tables are read from this file (written by gen_hand_rank_table.py) when it
+  # exists and matches TABLE_VERSION, otherwise they are generated in memory.
+  TABLE_VERSION = 2
+  TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hand_rank_table.bin")
+
+  @classmethod
+  def gen_board_state(self, community):
+    rank_keys, suit_keys = self.__rank_keys_by_rank, self.SUIT_KEYS
+    rank_key = suit_key = 0
+    suit_masks = { 2: 0, 4: 0, 8: 0, 16: 0 }
+    for card in community:
+      rank_key += rank_keys[card.rank]
+      suit_key += suit_keys[card.suit]
+      suit_masks[card.suit] |= 1 << (card.rank - 2)
+    return {
+        "community": community,
+        "rank_key": rank_key + self.CARD_NUM_OFFSETS.get(len(community) + 2, 0),
+        "suit_key": suit_key,
+        "suit_masks": suit_masks
+    }
+
+  @classmethod
+  def lookup_on_board(self, hole, board_state):
+    rank_keys, suit_keys = self.__rank_keys_by_rank, self.SUIT_KEYS
+    rank_key, suit_key = board_state["rank_key"], board_state["suit_key"]
+    for card in hole:
+      rank_key += rank_keys[card.rank]
+      suit_key += suit_keys[card.suit]
+    hand_flg = self.RANK_TABLE[rank_key]
+    flash_suit = self.FLASH_SUIT_TABLE[suit_key]
+    if flash_suit:
+      mask = board_state["suit_masks"][flash_suit]
+      for card in hole:
+        if card.suit == flash_suit: mask |= 1 << (card.rank - 2)
+      hand_flg = max(hand_flg, self.FLASH_TABLE[mask])
+    return hand_flg
+
+  # card_ids : (N, 5), (N, 6) or (N, 7) array of card ids
+  @classmethod
+  def lookup_batch(self, card_ids):
+    import numpy as np
+    tables = self.batch_tables()
+    rank_key = tables["rank_key"][card_ids].sum(axis=1) + self.CARD_NUM_OFFSETS[card_ids.shape[1]]
+    suit_key = tables["suit_key"][card_ids].sum(axis=1)
+    hand_flg = tables["rank_table"][rank_key]
+    flash_suit = tables["flash_suit_table"][suit_key]
+    in_flash_suit = tables["suit"][card_ids] == flash_suit[:, np.newaxis]
+    mask = np.where(in_flash_suit, tables["rank_bit"][card_ids], 0).sum(axis=1)
+    return np.maximum(hand_flg, tables["flash_table"][mask])
+
+  # numpy version of the tables and of card attributes indexed by card id
+  @classmethod
+  def batch_tables(self):
+    import numpy as np
+    if self.RANK_TABLE is None: self.setup()
+    if self.__batch_tables is None:
+      cards = [Card.from_id(card_id) for card_id in range(1, 53)]
+      by_id = lambda f: np.array([0] + [f(card) for card in cards], dtype=np.int64)
+      self.__batch_tables = {
+          "rank": by_id(lambda card: card.rank),
+          "suit": by_id(lambda card: card.suit),
+          "rank_bit": by_id(lambda card: 1 << (card.rank - 2)),
+          "rank_key": by_id(lambda card: self.__rank_keys_by_rank[card.rank]),
+          "suit_key": by_id(lambda card: self.SUIT_KEYS[card.suit]),
+          "rank_table": np.frombuffer(self.RANK_TABLE, dtype=np.uint16),
+          "flash_table": np.frombuffer(self.FLASH_TABLE, dtype=np.uint16).astype(np.int64),
+          "flash_suit_table": np.frombuffer(self.FLASH_SUIT_TABLE, dtype=np.uint8).astype(np.int64)
+      }
+    return self.__batch_tables
+
+  @classmethod
+  def setup(self, path=None):
+    if not self.load(path or self.TABLE_FILE):
+      self.RANK_TABLE, self.FLASH_TABLE, self.FLASH_SUIT_TABLE = self.__gen_tables()
+    self.__batch_tables = None
+
+  # Memory-map the table file read-only, so that every process which loads
+  # the same file shares its pages. Return False if the file is unusable.
+  @classmethod
+  def load(self, path):
+    buf = map_file(path)
+    if buf is None: return False
+    layout = self.__parse_header(buf)
+    if layout is None:
+      buf.close()
+      return False
+    self.RANK_TABLE, self.FLASH_TABLE, self.FLASH_SUIT_TABLE =\
+        view_arrays(buf, self.__FILE_HEADER.size, layout)
+    self.__batch_tables = None
+    return True
+
+  @classmethod
+  def save(self, path=None):
+    path = path or self.TABLE_FILE
+    tables = self.__gen_tables()
+    header = self.__FILE_HEADER.pack(self.__FILE_MAGIC, self.TABLE_VERSION,\
+        self.__BYTE_ORDER_MARK, *[len(table) for table in tables])
+    write_atomically(path, header + b"".join([table.tobytes() for table in tables]))
+
+  # File Format
+  # [magic(8byte)][version][byte order mark][size of each table (x3)][padding(4byte)]
+  # [RANK_TABLE(uint16)][FLASH_TABLE(uint16)][FLASH_SUIT_TABLE(uint8)]
+  __FILE_MAGIC = b"PPEHRTBL"
+  __FILE_HEADER = struct.Struct("=8sIIIII4x")
+  __BYTE_ORDER_MARK = 0x01020304
+
+  @classmethod
+  def __parse_header(self, buf):
+    if len(buf) < self.__FILE_HEADER.size: return None
+    magic, version, byte_order_mark, rank_size, flash_size, flash_suit_size =\
+        self.__FILE_HEADER.unpack_from(buf)
+    if magic != self.__FILE_MAGIC or version != self.TABLE_VERSION: return None
+    if byte_order_mark != self.__BYTE_ORDER_MARK: return None
+    layout = list(zip("HHB", [rank_size, flash_size, flash_suit_size]))
+    if len(buf) != self.__FILE_HEADER.size + calc_arrays_size(layout): return None
+    return layout
+
+  __rank_keys_by_rank = [0, 0] + RANK_KEYS
+  __batch_tables = None
+
+  @classmethod
+  def __gen_tables(self):
+    return self.__gen_rank_table(), self.__gen_flash_table(), self.__gen_flash_suit_table()
+
+  @classmethod
+  def __gen_rank_table(self):
+    offsets = self.CARD_NUM_OFFSETS
+    table = array('H', [0]) * max([self.__max_rank_key(n) + offsets[n] + 1 for n in offsets])
+    used_keys = set()
+    for card_num in offsets:
+      for ranks in combinations_with_replacement(range(2, 15), card_num):
+        if any([ranks.count(rank) > 4 for rank in ranks]): continue
+        # deal same ranks to different suits and no suit gets 5 cards
+        suit_masks = [0, 0, 0, 0]
+        for i, rank in enumerate(ranks): suit_masks[i % 4] |= 1 << (rank - 2)
+        rank_key = sum([self.__rank_keys_by_rank[rank] for rank in ranks]) + offsets[card_num]
+        if rank_key in used_keys: raise ValueError("Rank key %d is not unique" % rank_key)
+        used_keys.add(rank_key)
+        table[rank_key] = RankMaskTable.eval_suit_masks(suit_masks)
+    return table
+
+  @classmethod
+  def __gen_flash_table(self):
+    table = array('H', [0]) * (1 << 13)
+    for mask in range(1 << 13):
+      if RankMaskTable.POPCOUNT_TABLE[mask] >= 5:
+        table[mask] = RankMaskTable.eval_suit_masks([mask, 0, 0, 0])
+    return table
+
+  @classmethod
+  def __gen_flash_suit_table(self):
+    table = array('B', [0]) * (1 << 12)
+    for suit_key in range(1 << 12):
+      for suit, key in self.SUIT_KEYS.items():
+        if suit_key // key & 7 >= 5: table[suit_key] = suit
+    return table
+
+  @classmethod
+  def __max_rank_key(self, card_num):
+    keys = sorted(self.RANK_KEYS)[::-1]
+    return sum([keys[i // 4] for i in range(card_num)])
+
+RankMaskTable.setup()
+HandEvaluator.set_mode(os.environ.get("PYPOKERENGINE_HAND_EVALUATOR", HandEvaluator.TABLE_MODE))
@@ -1,5 +1,6 @@
 from pypokerengine.engine.pay_info import PayInfo
 from pypokerengine.engine.card import Card
+from pypokerengine.engine.card_set import CardSet
 from pypokerengine.engine.poker_constants import PokerConstants as Const
 
 
@@ -29,11 +30,14 @@ class Player:
       raise ValueError(self.__wrong_num_hole_msg % (len(cards)))
     if not all([isinstance(card, Card) for card in cards]):
       raise ValueError(self.__wrong_type_hole_msg)
-    self.hole_card = cards
+    self.hole_card = list(cards)
 
   def clear_holecard(self):
     self.hole_card = []
 
+  def hole_card_set(self):
+    return CardSet(self.hole_card)
+
   def append_chip(self, amount):
     self.stack += amount
 
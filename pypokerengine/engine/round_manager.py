@@ -16,7 +16,7 @@ class RoundManager:
     state = self.__deep_copy_state(_state)
     table = state["table"]
 
-    table.deck.shuffle()
+    table.deck.shuffle(self.__dealt_card_num(table.seats.players))
     self.__correct_ante(ante_amount, table.seats.players)
     self.__correct_blind(small_blind_amount, table)
     self.__deal_holecard(table.deck, table.seats.players)
@@ -66,6 +66,11 @@ class RoundManager:
     player.add_action_history(action, sb_amount=sb_amount)
     player.pay_info.update_by_pay(blind_amount)
 
+  # hole cards of every seat and 5 community cards
+  @classmethod
+  def __dealt_card_num(self, players):
+    return 2 * len(players) + 5
+
   @classmethod
   def __deal_holecard(self, deck, players):
     for player in players:
@@ -234,7 +239,9 @@ class RoundManager:
 
   @classmethod
   def __deep_copy_state(self, state):
-    table_deepcopy = Table.deserialize(state["table"].serialize())
+    # the copy goes on with the deck stream and the deal schedule of the game
+    table = state["table"]
+    table_deepcopy = Table.deserialize(table.serialize(), deck_rng=table.deck.rng, deck_schedule=table.deck.schedule)
     return {
         "round_count": state["round_count"],
         "small_blind_amount": state["small_blind_amount"],
@@ -1,14 +1,15 @@
 from pypokerengine.engine.card import Card
+from pypokerengine.engine.card_set import CardSet
 from pypokerengine.engine.seats import Seats
 from pypokerengine.engine.deck import Deck
 
 class Table:
 
-  def __init__(self, cheat_deck=None):
+  def __init__(self, cheat_deck=None, seed=None):
     self.dealer_btn = 0
     self._blind_pos = None
     self.seats = Seats()
-    self.deck = cheat_deck if cheat_deck else Deck()
+    self.deck = cheat_deck if cheat_deck else Deck(seed=seed)
     self._community_card = []
 
   def set_blind_pos(self, sb_pos, bb_pos):
@@ -25,6 +26,9 @@ class Table:
   def get_community_card(self):
     return self._community_card[::]
 
+  def get_community_card_set(self):
+    return CardSet(self._community_card)
+
   def add_community_card(self, card):
     if len(self._community_card) == 5:
       raise ValueError(self.__exceed_card_size_msg)
@@ -54,9 +58,10 @@ class Table:
         Deck.serialize(self.deck), community_card, self._blind_pos
     ]
 
+  # deck_rng, deck_schedule : handed over to the deck (see Deck.deserialize)
   @classmethod
-  def deserialize(self, serial):
-    deck = Deck.deserialize(serial[2])
+  def deserialize(self, serial, deck_rng=None, deck_schedule=None):
+    deck = Deck.deserialize(serial[2], rng=deck_rng, schedule=deck_schedule)
     community_card = [Card.from_id(cid) for cid in serial[3]]
     table = self(cheat_deck=deck)
     table.dealer_btn = serial[0]
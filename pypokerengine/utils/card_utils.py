@@ -1,25 +1,257 @@
-import random
+import json
+import time
+import atexit
+from itertools import combinations
+from collections import OrderedDict
 
 from pypokerengine.engine.card import Card
+from pypokerengine.engine.card_set import CardSet
 from pypokerengine.engine.deck import Deck
 from pypokerengine.engine.hand_evaluator import HandEvaluator
+from pypokerengine.utils.rng_utils import gen_rng, derive_seed
+from pypokerengine.utils.math_utils import comb
+from pypokerengine.utils.file_utils import write_atomically
+from pypokerengine.utils.preflop_equity_utils import lookup_preflop_win_rate
+from pypokerengine.utils.flop_equity_utils import lookup_flop_win_rate, get_flop_table_nb_simulation, gen_canonical_ids
 
 def gen_cards(cards_str):
     return [Card.from_str(s) for s in cards_str]
 
-def estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None):
+MONTECARLO_BATCH_SIZE = 16384
+EXACT_ENUMERATION_LIMIT = 50000
+EQUITY_CACHE_SIZE = 4096
+PARALLEL_SIMULATION_THRESHOLD = 1000000
+PARALLEL_CHUNK_SIZE = 250000
+
+# Sampling modes of the Monte Carlo (all but "random" need numpy and the table evaluator mode)
+#   random     : independent uniform draws
+#   stratified : every draw step is stratified over the batch (Latin hypercube),
+#                so each card comes out as the first missing board card equally often
+#   quasi      : uniforms from a randomly shifted Kronecker (low discrepancy) sequence
+#   common     : common random numbers. Draws come from a random order of all 52 cards
+#                which depends only on the seed, so calls with the same seed and different
+#                hole cards, boards or player counts are positively correlated and their
+#                difference has a lower variance.
+SAMPLING_MODES = ["random", "stratified", "quasi", "common"]
+
+# Preflop win rates come from the shipped preflop equity table, and heads-up
+# flop win rates from the shipped flop equity table (when it is exact or
+# simulated at least nb_simulation times). Heads-up spots with at most max(nb_simulation, EXACT_ENUMERATION_LIMIT)
+# deals left (the turn and the river) are enumerated exactly instead of sampled.
+# Card by card (in the bitmask mode or without numpy) enumeration is slower
+# than sampling, so only spots with at most nb_simulation deals are enumerated.
+#
+# Results are kept in an LRU cache keyed on the spot up to suit isomorphism
+# (with nb_simulation and nb_player). Seeded calls skip the cache so that
+# they reproduce their own samples.
+def estimate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None, seed=None):
+    if not community_card: community_card = []
+    if seed is not None or EQUITY_CACHE_SIZE == 0:
+        return _estimate_win_rate(nb_simulation, nb_player, hole_card, community_card, seed)
+    key = _gen_equity_cache_key(nb_simulation, nb_player, hole_card, community_card)
+    if key in _equity_cache:
+        _equity_cache_stats["hits"] += 1
+        win_rate = _equity_cache.pop(key)
+    else:
+        _equity_cache_stats["misses"] += 1
+        win_rate = _estimate_win_rate(nb_simulation, nb_player, hole_card, community_card, seed)
+        if len(_equity_cache) >= EQUITY_CACHE_SIZE:
+            _equity_cache.popitem(last=False)
+    _equity_cache[key] = win_rate
+    return win_rate
+
+def set_equity_cache_size(size):
+    global EQUITY_CACHE_SIZE
+    EQUITY_CACHE_SIZE = size
+    while len(_equity_cache) > size:
+        _equity_cache.popitem(last=False)
+
+def get_equity_cache_info():
+    return {
+            "hits": _equity_cache_stats["hits"],
+            "misses": _equity_cache_stats["misses"],
+            "size": len(_equity_cache),
+            "capacity": EQUITY_CACHE_SIZE
+            }
+
+def clear_equity_cache():
+    _equity_cache.clear()
+    _equity_cache_stats["hits"] = _equity_cache_stats["misses"] = 0
+
+# File Format (json)
+#   { "version": 1, "entries": [[nb_simulation, nb_player, hole ids, board ids, win rate], ...] }
+# Entries are written from the least recently used one.
+def save_equity_cache(path):
+    entries = [list(key[:2]) + [list(key[2]), list(key[3]), win_rate] for key, win_rate in _equity_cache.items()]
+    write_atomically(path, json.dumps({ "version": EQUITY_CACHE_VERSION, "entries": entries }), binary=False)
+
+# Return the number of loaded entries (the cache keeps at most EQUITY_CACHE_SIZE)
+def load_equity_cache(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != EQUITY_CACHE_VERSION:
+        raise ValueError("%s is not an equity cache file of version %d" % (path, EQUITY_CACHE_VERSION))
+    for nb_simulation, nb_player, hole_ids, board_ids, win_rate in data["entries"]:
+        key = (nb_simulation, nb_player, tuple(hole_ids), tuple(board_ids))
+        _equity_cache.pop(key, None)
+        _equity_cache[key] = win_rate
+    set_equity_cache_size(EQUITY_CACHE_SIZE)
+    return len(data["entries"])
+
+EQUITY_CACHE_VERSION = 1
+_equity_cache = OrderedDict()
+_equity_cache_stats = { "hits": 0, "misses": 0 }
+
+def _estimate_win_rate(nb_simulation, nb_player, hole_card, community_card, seed):
+    if not community_card:
+        win_rate = lookup_preflop_win_rate(hole_card, nb_player)
+        if win_rate is not None: return win_rate
+    if nb_player == 2 and len(community_card) == 3 and _is_flop_table_usable(nb_simulation):
+        win_rate = lookup_flop_win_rate(hole_card, community_card)
+        if win_rate is not None: return win_rate
+    enumeration_limit = max(nb_simulation, EXACT_ENUMERATION_LIMIT) if _import_batch_numpy() is not None else nb_simulation
+    if nb_player == 2 and _count_heads_up_deals(community_card) <= enumeration_limit:
+        return enumerate_hole_card_win_rate(hole_card, community_card)
+    return simulate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card, seed)
+
+# Exact heads-up win rate over every remaining deal (the opponent's hole card and the board)
+def enumerate_hole_card_win_rate(hole_card, community_card=None):
+    community_card = community_card or []
+    np = _import_batch_numpy()
+    if np is not None: return _enumerate_win_rate_batch(np, hole_card, community_card)
+    return _enumerate_win_rate(hole_card, community_card)
+
+# Monte Carlo estimate of estimate_hole_card_win_rate, whatever the spot
+def simulate_hole_card_win_rate(nb_simulation, nb_player, hole_card, community_card=None, seed=None, sampling="random"):
+    counts = _simulate_result_counts(nb_simulation, nb_player, hole_card, community_card or [], seed, sampling)
+    return 1.0 * (nb_simulation - counts[1]) / nb_simulation
+
+# Monte Carlo equity where a pot tied with k opponents counts as 1 / (k + 1).
+# Every figure of the EquityResult comes from the same samples.
+def estimate_hole_card_equity(nb_simulation, nb_player, hole_card, community_card=None, seed=None, sampling="random"):
+    return EquityResult(_simulate_result_counts(nb_simulation, nb_player, hole_card, community_card or [], seed, sampling))
+
+class EquityResult(object):
+
+    # counts : [win, lose, tie with 1 opponent, tie with 2 opponents, ...]
+    def __init__(self, counts):
+        self.counts = list(counts)
+        self.win, self.lose, self.tie = counts[0], counts[1], sum(counts[2:])
+        self.nb_simulation = sum(counts)
+        shares = [(counts[k + 1], 1.0 / (k + 1)) for k in range(1, len(counts) - 1)]
+        n = self.nb_simulation
+        # win rate with ties counted as wins (as estimate_hole_card_win_rate)
+        self.win_rate = 1.0 * (self.win + self.tie) / n
+        self.equity = (self.win + sum([count * share for count, share in shares])) / n
+        mean_square = (self.win + sum([count * share ** 2 for count, share in shares])) / n
+        self.variance = max(mean_square - self.equity ** 2, 0.0) * n / (n - 1) if n > 1 else 0.0
+        self.std_error = (self.variance / n) ** 0.5
+
+    def __repr__(self):
+        return "EquityResult(win=%d, tie=%d, lose=%d, equity=%.4f, std_error=%.4f)" %\
+                (self.win, self.tie, self.lose, self.equity, self.std_error)
+
+# At least PARALLEL_SIMULATION_THRESHOLD simulations are split into chunks of
+# PARALLEL_CHUNK_SIZE, each with a seed derived from seed and its index. The
+# chunks run on the simulation pool if it is started (in this process if not)
+# and their counts are summed, so the result is the same either way.
+def _simulate_result_counts(nb_simulation, nb_player, hole_card, community_card, seed, sampling="random"):
+    if sampling not in SAMPLING_MODES:
+        raise ValueError("Unknown sampling mode %s (must be one of %s)" % (sampling, SAMPLING_MODES))
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    if nb_simulation < PARALLEL_SIMULATION_THRESHOLD:
+        return _count_results(nb_simulation, nb_player, hole_ids, community_ids, seed, sampling)
+    base_seed = gen_rng(seed).getrandbits(64)
+    chunks = [(min(PARALLEL_CHUNK_SIZE, nb_simulation - start), nb_player, hole_ids, community_ids, derive_seed(base_seed, i), sampling)
+            for i, start in enumerate(range(0, nb_simulation, PARALLEL_CHUNK_SIZE))]
+    chunk_map = _simulation_pool.map if _simulation_pool is not None else map
+    return [sum(counts) for counts in zip(*chunk_map(_count_chunk_results, chunks))]
+
+# Start a persistent pool of processes (cpu count if None) for large simulations
+def start_simulation_pool(processes=None):
+    global _simulation_pool
+    from concurrent.futures import ProcessPoolExecutor
+    shutdown_simulation_pool()
+    _simulation_pool = ProcessPoolExecutor(processes)
+
+def shutdown_simulation_pool():
+    global _simulation_pool
+    if _simulation_pool is not None:
+        _simulation_pool.shutdown()
+        _simulation_pool = None
+
+_simulation_pool = None
+atexit.register(shutdown_simulation_pool)
+
+# Sample min_simulation, then batches of batch_size until the standard error of
+# the win rate is at most std_error or max_simulation samples are used.
+# The standard error is taken at (win + 1) / (n + 2), so that a batch which
+# is all wins or all losses does not stop the sampling by itself.
+#
+# Return Format
+#   { "win_rate": float, "std_error": float, "nb_simulation": int }
+def estimate_hole_card_win_rate_to_precision(max_simulation, nb_player, hole_card, community_card=None,
+        std_error=0.01, min_simulation=64, batch_size=256, seed=None):
+    if not community_card: community_card = []
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    rng = gen_rng(seed)
+    win_count, nb_simulation = 0, 0
+    while nb_simulation < max_simulation:
+        size = min(batch_size if nb_simulation else min_simulation, max_simulation - nb_simulation)
+        win_count += _count_wins(size, nb_player, hole_ids, community_ids, rng)
+        nb_simulation += size
+        if _calc_std_error(win_count, nb_simulation) <= std_error: break
+    return {
+            "win_rate": 1.0 * win_count / nb_simulation,
+            "std_error": _calc_std_error(win_count, nb_simulation),
+            "nb_simulation": nb_simulation
+            }
+
+# Sample until the wall-clock deadline (a time.time() value) and return the
+# estimate so far. Batches start at min_simulation and double up to
+# max_batch_size. A batch is only started if it is expected to finish before
+# the deadline, judged from the time per sample of the batches so far. The
+# first batch always runs, so there is an estimate even if the deadline has
+# passed.
+#
+# Return Format
+#   { "win_rate": float, "std_error": float, "nb_simulation": int }
+def estimate_hole_card_win_rate_until(deadline, nb_player, hole_card, community_card=None,
+        min_simulation=64, max_batch_size=16384, seed=None):
     if not community_card: community_card = []
-    win_count = sum([_montecarlo_simulation(nb_player, hole_card, community_card) for _ in range(nb_simulation)])
-    return 1.0 * win_count / nb_simulation
+    hole_ids = [card.to_id() for card in hole_card]
+    community_ids = [card.to_id() for card in community_card]
+    rng = gen_rng(seed)
+    win_count, nb_simulation, size, started = 0, 0, min_simulation, time.time()
+    while True:
+        win_count += _count_wins(size, nb_player, hole_ids, community_ids, rng)
+        nb_simulation += size
+        now = time.time()
+        size = min(2 * size, max_batch_size)
+        time_per_sample = (now - started) / nb_simulation
+        if now + size * time_per_sample > deadline:
+            size = int((deadline - now) / time_per_sample) if time_per_sample else 0
+            if size < min_simulation: break
+    return {
+            "win_rate": 1.0 * win_count / nb_simulation,
+            "std_error": _calc_std_error(win_count, nb_simulation),
+            "nb_simulation": nb_simulation
+            }
+
+def _calc_std_error(win_count, nb_simulation):
+    win_rate = (win_count + 1.0) / (nb_simulation + 2)
+    return (win_rate * (1 - win_rate) / nb_simulation) ** 0.5
 
 def gen_deck(exclude_cards=None):
     deck_ids = range(1, 53)
     if exclude_cards:
-        assert isinstance(exclude_cards, list)
-        if isinstance(exclude_cards[0], str):
-            exclude_cards = [Card.from_str(s) for s in exclude_cards]
-        exclude_ids = [card.to_id() for card in exclude_cards]
-        deck_ids = [i for i in deck_ids if not i in exclude_ids]
+        if not isinstance(exclude_cards, CardSet):
+            assert isinstance(exclude_cards, list)
+            if isinstance(exclude_cards[0], str):
+                exclude_cards = [Card.from_str(s) for s in exclude_cards]
+        deck_ids = (CardSet.full() - exclude_cards).to_ids()
     return Deck(deck_ids)
 
 def evaluate_hand(hole_card, community_card):
@@ -30,21 +262,176 @@ def evaluate_hand(hole_card, community_card):
             "strength": HandEvaluator.eval_hand(hole_card, community_card)
             }
 
-def _montecarlo_simulation(nb_player, hole_card, community_card):
-    community_card = _fill_community_card(community_card, used_card=hole_card+community_card)
-    unused_cards = _pick_unused_card((nb_player-1)*2, hole_card + community_card)
-    opponents_hole = [unused_cards[2*i:2*i+2] for i in range(nb_player-1)]
-    opponents_score = [HandEvaluator.eval_hand(hole, community_card) for hole in opponents_hole]
-    my_score = HandEvaluator.eval_hand(hole_card, community_card)
+# Spots which differ only by a permutation of suits share the key.
+def _gen_equity_cache_key(nb_simulation, nb_player, hole_card, community_card):
+    return (nb_simulation, nb_player) + gen_canonical_ids(hole_card, community_card)
+
+def _is_flop_table_usable(nb_simulation):
+    table_nb_simulation = get_flop_table_nb_simulation()
+    return table_nb_simulation is not None and (table_nb_simulation == 0 or table_nb_simulation >= nb_simulation)
+
+def _montecarlo_simulation(nb_player, hole_card, community_card, rng=None):
+    my_score, opponents_score = _simulate_scores(nb_player, hole_card, community_card, rng)
     return 1 if my_score >= max(opponents_score) else 0
 
-def _fill_community_card(base_cards, used_card):
+def _simulate_scores(nb_player, hole_card, community_card, rng):
+    community_card = _fill_community_card(community_card, used_card=hole_card+community_card, rng=rng)
+    unused_cards = _pick_unused_card((nb_player-1)*2, hole_card + community_card, rng)
+    opponents_hole = [unused_cards[2*i:2*i+2] for i in range(nb_player-1)]
+    board_state = HandEvaluator.gen_board_state(community_card)
+    opponents_score = [HandEvaluator.eval_hand_on_board(hole, board_state) for hole in opponents_hole]
+    my_score = HandEvaluator.eval_hand_on_board(hole_card, board_state)
+    return my_score, opponents_score
+
+def _count_wins(nb_simulation, nb_player, hole_ids, community_ids, seed):
+    return nb_simulation - _count_results(nb_simulation, nb_player, hole_ids, community_ids, seed)[1]
+
+# [win, lose, tie with 1 opponent, tie with 2 opponents, ...] of the simulations.
+# Only card ids are passed, so that a chunk is cheap to send to a worker process.
+def _count_results(nb_simulation, nb_player, hole_ids, community_ids, seed, sampling="random"):
+    hole_card = [Card.from_id(card_id) for card_id in hole_ids]
+    community_card = [Card.from_id(card_id) for card_id in community_ids]
+    np = _import_batch_numpy()
+    if np is not None:
+        return _count_results_batch(np, nb_simulation, nb_player, hole_card, community_card, seed, sampling)
+    if sampling != "random":
+        raise ValueError("Sampling mode %s needs numpy and the table evaluator mode" % sampling)
+    rng, counts = gen_rng(seed), [0] * (nb_player + 1)
+    for _ in range(nb_simulation):
+        my_score, opponents_score = _simulate_scores(nb_player, hole_card, community_card, rng)
+        best_score = max(opponents_score)
+        if my_score != best_score:
+            counts[0 if my_score > best_score else 1] += 1
+        else:
+            counts[1 + opponents_score.count(my_score)] += 1
+    return counts
+
+def _count_chunk_results(chunk):
+    return _count_results(*chunk)
+
+# Same simulation as _montecarlo_simulation for a whole batch at once.
+# The cards of each simulation are drawn as integer ids and scored with
+# HandEvaluator.eval_hand_batch, so no Card is built in the loop.
+def _count_results_batch(np, nb_simulation, nb_player, hole_card, community_card, seed, sampling="random"):
+    np_rng = np.random.default_rng(gen_rng(seed).getrandbits(64))
+    hole_ids = np.array([[card.to_id() for card in hole_card]], dtype=np.intp)
+    community_ids = np.array([[card.to_id() for card in community_card]], dtype=np.intp).reshape(1, -1)
+    unused_ids = np.array((CardSet.full() - hole_card - community_card).to_ids(), dtype=np.intp)
+    need_num, opponent_num = 5 - len(community_card), nb_player - 1
+    counts = np.zeros(nb_player + 1, dtype=np.int64)
+    for start in range(0, nb_simulation, MONTECARLO_BATCH_SIZE):
+        size = min(MONTECARLO_BATCH_SIZE, nb_simulation - start)
+        drawn = _sample_unused_ids(np, np_rng, unused_ids, size, need_num + 2 * opponent_num, sampling)
+        boards = np.hstack([np.repeat(community_ids, size, axis=0), drawn[:, :need_num]])
+        my_score = HandEvaluator.eval_hand_batch(np.repeat(hole_ids, size, axis=0), boards)
+        opponents_hole = drawn[:, need_num:].reshape(size * opponent_num, 2)
+        opponents_score = HandEvaluator.eval_hand_batch(opponents_hole, np.repeat(boards, opponent_num, axis=0))
+        opponents_score = opponents_score.reshape(size, opponent_num)
+        best_score = opponents_score.max(axis=1)
+        # 0 : win, 1 : lose, 1 + k : tie with k opponents
+        result = np.where(my_score > best_score, 0, np.where(my_score < best_score, 1,\
+                1 + np.count_nonzero(opponents_score == my_score[:, np.newaxis], axis=1)))
+        counts += np.bincount(result, minlength=nb_player + 1)
+    return [int(count) for count in counts]
+
+# Exact win rate against one opponent over every remaining board and opponent hole card
+def _enumerate_win_rate(hole_card, community_card):
+    unused = list(CardSet.full() - hole_card - community_card)
+    win_count, deal_count = 0, 0
+    for next_cards in combinations(unused, 5 - len(community_card)):
+        board_state = HandEvaluator.gen_board_state(community_card + list(next_cards))
+        my_score = HandEvaluator.eval_hand_on_board(hole_card, board_state)
+        rest = [card for card in unused if card not in next_cards]
+        for opponent_hole in combinations(rest, 2):
+            win_count += my_score >= HandEvaluator.eval_hand_on_board(opponent_hole, board_state)
+            deal_count += 1
+    return 1.0 * win_count / deal_count
+
+def _enumerate_win_rate_batch(np, hole_card, community_card):
+    hole_ids = np.array([[card.to_id() for card in hole_card]], dtype=np.intp)
+    community_ids = np.array([[card.to_id() for card in community_card]], dtype=np.intp).reshape(1, -1)
+    unused_ids = np.array((CardSet.full() - hole_card - community_card).to_ids(), dtype=np.intp)
+    need_num = 5 - len(community_card)
+    next_idx = list(combinations(range(len(unused_ids)), need_num))
+    next_ids = unused_ids[np.array(next_idx, dtype=np.intp).reshape(len(next_idx), need_num)]
+    boards = np.hstack([np.repeat(community_ids, len(next_ids), axis=0), next_ids])
+    my_score = HandEvaluator.eval_hand_batch(np.repeat(hole_ids, len(boards), axis=0), boards)
+    # every (board, opponent hole card) pair which does not reuse a card
+    first, second = np.triu_indices(len(unused_ids), k=1)
+    opponent_ids = np.stack([unused_ids[first], unused_ids[second]], axis=1)
+    unused = ((opponent_ids[np.newaxis, :, 0, np.newaxis] != next_ids[:, np.newaxis, :]) &\
+            (opponent_ids[np.newaxis, :, 1, np.newaxis] != next_ids[:, np.newaxis, :])).all(axis=2)
+    board_idx, opponent_idx = np.nonzero(unused)
+    opponent_score = HandEvaluator.eval_hand_batch(opponent_ids[opponent_idx], boards[board_idx])
+    return float(np.count_nonzero(my_score[board_idx] >= opponent_score)) / len(opponent_score)
+
+def _count_heads_up_deals(community_card):
+    unused_num, need_num = 50 - len(community_card), 5 - len(community_card)
+    return comb(unused_num, need_num) * comb(unused_num - need_num, 2)
+
+# (size, card_num) array of card ids, each row drawn without replacement
+# by a partial Fisher-Yates shuffle which runs on all rows at once
+def _sample_unused_ids(np, np_rng, unused_ids, size, card_num, sampling="random"):
+    if sampling == "common": return _sample_common_ids(np, np_rng, unused_ids, size, card_num)
+    uniforms = None if sampling == "random" else _gen_uniforms(np, np_rng, size, card_num, sampling)
+    ids, rows = np.tile(unused_ids, (size, 1)), np.arange(size)
+    for i in range(card_num):
+        if uniforms is None:
+            j = np_rng.integers(i, len(unused_ids), size)
+        else:
+            j = i + (uniforms[:, i] * (len(unused_ids) - i)).astype(np.intp)
+        picked = ids[rows, j]
+        ids[rows, j] = ids[:, i]
+        ids[:, i] = picked
+    return ids[:, :card_num]
+
+# (size, card_num) uniforms in [0, 1) which drive the draw steps
+def _gen_uniforms(np, np_rng, size, card_num, sampling):
+    if sampling == "stratified":
+        strata = np.argsort(np_rng.random((size, card_num)), axis=0)
+        return (strata + np_rng.random((size, card_num))) / size
+    if sampling == "quasi":
+        steps = np.sqrt(np.array(_gen_primes(card_num), dtype=float)) % 1
+        return (np_rng.random(card_num) + np.arange(size)[:, np.newaxis] * steps) % 1
+    raise ValueError("Unknown sampling mode %s" % sampling)
+
+# The first n primes (the steps of the Kronecker sequence are their square roots)
+def _gen_primes(n):
+    primes, candidate = [], 2
+    while len(primes) < n:
+        if all([candidate % prime for prime in primes if prime * prime <= candidate]): primes.append(candidate)
+        candidate += 1
+    return primes
+
+# The first card_num unused cards in a random order of all 52 cards. The order
+# does not depend on which cards are used, which makes the numbers common.
+def _sample_common_ids(np, np_rng, unused_ids, size, card_num):
+    keys = np_rng.random((size, 52))
+    used = np.ones(52, dtype=bool)
+    used[unused_ids - 1] = False
+    keys[:, used] = 2.0
+    return np.argsort(keys, axis=1)[:, :card_num] + 1
+
+# numpy is optional. Without it the simulation runs card by card.
+def _import_numpy():
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+# HandEvaluator.eval_hand_batch loads the full rank tables, so the batch paths
+# only run in the table mode. In the bitmask mode they run card by card.
+def _import_batch_numpy():
+    if HandEvaluator.get_mode() != HandEvaluator.TABLE_MODE: return None
+    return _import_numpy()
+
+def _fill_community_card(base_cards, used_card, rng=None):
     need_num = 5 - len(base_cards)
-    return base_cards + _pick_unused_card(need_num, used_card)
+    return base_cards + _pick_unused_card(need_num, used_card, rng)
 
-def _pick_unused_card(card_num, used_card):
-    used = [card.to_id() for card in used_card]
-    unused = [card_id for card_id in range(1, 53) if card_id not in used]
-    choiced = random.sample(unused, card_num)
+def _pick_unused_card(card_num, used_card, rng=None):
+    unused = (CardSet.full() - used_card).to_ids()
+    choiced = gen_rng(rng).sample(unused, card_num)
     return [Card.from_id(card_id) for card_id in choiced]
 
@@ -0,0 +1,67 @@
+import struct
+
+from pypokerengine.engine.deck import Deck
+from pypokerengine.utils.file_utils import write_atomically
+from pypokerengine.utils.rng_utils import spawn_rng
+
+# Deal schedule of a duplicate match : the cards dealt in every round of every
+# game, fixed before the match so that a game can be replayed with the seats
+# swapped. Each round keeps only the card_num cards it deals (2 per player and
+# 5 community cards), one byte per card id in draw order.
+#
+# Schedule Format
+#   { "game_num": int, "round_num": int, "card_num": int, "deals": bytes }
+
+SCHEDULE_VERSION = 1
+
+def gen_deal_schedule(game_num, round_num, nb_player=2, seed=None):
+    card_num = 2 * nb_player + 5
+    deals = bytearray()
+    for game in range(game_num):
+        rng = spawn_rng(seed, game)
+        for _ in range(round_num):
+            deals += bytearray(rng.sample(range(1, 53), card_num))
+    return _format_schedule(game_num, round_num, card_num, bytes(deals))
+
+def gen_schedule_deck(schedule, game):
+    return Deck(schedule=iter_game_deals(schedule, game))
+
+# A list iterator (not a generator), so that a deck of the schedule can be pickled
+def iter_game_deals(schedule, game):
+    if not 0 <= game < schedule["game_num"]:
+        raise ValueError("game %d is not in the schedule of %d games" % (game, schedule["game_num"]))
+    card_num, deals = schedule["card_num"], schedule["deals"]
+    start = game * schedule["round_num"] * card_num
+    offsets = range(start, start + schedule["round_num"] * card_num, card_num)
+    return iter([deals[offset:offset + card_num] for offset in offsets])
+
+# File Format
+#   [magic(8byte)][version][game_num][round_num][card_num][deals(uint8)]
+def save_deal_schedule(path, schedule):
+    header = _FILE_HEADER.pack(_FILE_MAGIC, SCHEDULE_VERSION,\
+            schedule["game_num"], schedule["round_num"], schedule["card_num"])
+    write_atomically(path, header + schedule["deals"])
+
+def load_deal_schedule(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _FILE_HEADER.size:
+        raise ValueError("%s is not a deal schedule file" % path)
+    magic, version, game_num, round_num, card_num = _FILE_HEADER.unpack_from(data)
+    if magic != _FILE_MAGIC or version != SCHEDULE_VERSION:
+        raise ValueError("%s is not a deal schedule file of version %d" % (path, SCHEDULE_VERSION))
+    deals = data[_FILE_HEADER.size:]
+    if len(deals) != game_num * round_num * card_num:
+        raise ValueError("%s is truncated" % path)
+    return _format_schedule(game_num, round_num, card_num, deals)
+
+_FILE_MAGIC = b"PPDEALSC"
+_FILE_HEADER = struct.Struct("<8sIIII")
+
+def _format_schedule(game_num, round_num, card_num, deals):
+    return {
+            "game_num": game_num,
+            "round_num": round_num,
+            "card_num": card_num,
+            "deals": deals
+            }
@@ -0,0 +1,53 @@
+import os
+import mmap
+from array import array
+
+# Write data (bytes, or str if binary is False) to a temporary file and rename
+# it over path, so that readers never see a half written file.
+def write_atomically(path, data, binary=True):
+    tmp_path = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmp_path, "wb" if binary else "w") as f:
+        f.write(data)
+    os.rename(tmp_path, path)
+
+# Memory-map the file read-only, so that every process which maps the same
+# file shares its pages. Return None if the file cannot be mapped.
+def map_file(path):
+    try:
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, OSError, ValueError):
+        return None
+
+# layout : list of (array typecode, item num) of the arrays stored one after
+#          another from offset
+# Return the arrays as views of buf. Pythons which cannot cast a view of an
+# mmap (python 2) get copies in arrays instead, and buf is closed.
+def view_arrays(buf, offset, layout):
+    try:
+        return _cast_arrays(buf, offset, layout)
+    except (TypeError, AttributeError):
+        arrays = _read_arrays(buf, offset, layout)
+        buf.close()
+        return arrays
+
+def calc_arrays_size(layout):
+    return sum([array(typecode).itemsize * size for typecode, size in layout])
+
+def _cast_arrays(buf, offset, layout):
+    view, arrays = memoryview(buf), []
+    for typecode, size in layout:
+        itemsize = array(typecode).itemsize
+        arrays.append(view[offset:offset + size * itemsize].cast(typecode))
+        offset += size * itemsize
+    return arrays
+
+def _read_arrays(buf, offset, layout):
+    arrays = []
+    for typecode, size in layout:
+        table = array(typecode)
+        data = buf[offset:offset + size * table.itemsize]
+        table.frombytes(data) if hasattr(table, "frombytes") else table.fromstring(data)
+        arrays.append(table)
+        offset += size * table.itemsize
+    return arrays
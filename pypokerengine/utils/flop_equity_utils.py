@@ -0,0 +1,117 @@
+import os
+import struct
+from bisect import bisect_left
+from itertools import combinations
+
+from pypokerengine.engine.card import Card
+from pypokerengine.utils.file_utils import write_atomically, map_file, view_arrays, calc_arrays_size
+from pypokerengine.utils.preflop_equity_utils import gen_all_hand_classes, gen_class_hole_card
+
+# Heads-up flop win rate (as estimate_hole_card_win_rate) of every hole card
+# and flop up to suit isomorphism, generated offline by gen_flop_equity_table.py.
+#
+# The table is a memory-mapped file of the spot keys in ascending order and
+# the win rates in the same order. The key of a spot is its canonical card ids
+# packed in 30 bits (6 bits per card), so a lookup is a binary search of the
+# mapped keys.
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "flop_equity_table.bin")
+TABLE_VERSION = 2
+
+# Card ids after renaming the suits in the order of their (hole ranks, board
+# ranks), so spots which differ only by a permutation of suits get the same ids.
+def gen_canonical_ids(hole_card, community_card):
+    signature = lambda suit: ([card.rank for card in hole_card if card.suit == suit],\
+            [card.rank for card in community_card if card.suit == suit])
+    suits = sorted(Card.SUIT_MAP, key=lambda suit: [sorted(ranks) for ranks in signature(suit)], reverse=True)
+    canonical_suit = dict(zip(suits, sorted(Card.SUIT_MAP)))
+    canonical_ids = lambda cards: tuple(sorted([Card(canonical_suit[card.suit], card.rank).to_id() for card in cards]))
+    return canonical_ids(hole_card), canonical_ids(community_card)
+
+# Return None if the table file is not generated (or the spot is not a flop)
+def lookup_flop_win_rate(hole_card, community_card):
+    if len(community_card) != 3 or not _fetch_table(): return None
+    key = _pack_key(*gen_canonical_ids(hole_card, community_card))
+    keys = _table["keys"]
+    i = bisect_left(keys, key)
+    if i == len(keys) or keys[i] != key: return None
+    return _table["values"][i] / 65535.0
+
+# Simulations per entry of the loaded table (0 if exact), None if it is not generated
+def get_flop_table_nb_simulation():
+    return _table["nb_simulation"] if _fetch_table() else None
+
+def load_flop_equity_table(path=None):
+    global _table
+    _table = {}
+    buf = map_file(path or TABLE_FILE)
+    if buf is None: return False
+    header = _parse_header(buf)
+    if header is None:
+        buf.close()
+        return False
+    entry_num, nb_simulation = header
+    keys, values = view_arrays(buf, _FILE_HEADER.size, _gen_layout(entry_num))
+    _table = {
+            "keys": keys,
+            "values": values,
+            "entry_num": entry_num,
+            "nb_simulation": nb_simulation
+            }
+    return True
+
+# Every (hole ids, flop ids) spot up to suit isomorphism (1,286,792 spots)
+def gen_canonical_spots():
+    spots = set()
+    for hand_class in gen_all_hand_classes():
+        hole_card = gen_class_hole_card(hand_class)
+        rest = [card for card in (Card.from_id(card_id) for card_id in range(1, 53)) if card not in hole_card]
+        for flop in combinations(rest, 3):
+            spots.add(gen_canonical_ids(hole_card, list(flop)))
+    return sorted(spots)
+
+# Every flop up to suit isomorphism (1,755 flops), as canonical flop ids
+def gen_canonical_flops():
+    cards = [Card.from_id(card_id) for card_id in range(1, 53)]
+    return sorted(set([gen_canonical_ids([], list(flop))[1] for flop in combinations(cards, 3)]))
+
+# entries : list of ((hole ids, flop ids), win rate)
+def save_flop_equity_table(entries, nb_simulation, path=None):
+    global _table
+    path = path or TABLE_FILE
+    packed = sorted([(_pack_key(hole_ids, flop_ids), int(round(win_rate * 65535)))
+        for (hole_ids, flop_ids), win_rate in entries])
+    keys, values = [key for key, _ in packed], [value for _, value in packed]
+    header = _FILE_HEADER.pack(_FILE_MAGIC, TABLE_VERSION, _BYTE_ORDER_MARK, len(entries), nb_simulation)
+    write_atomically(path, header + struct.pack("=%dI" % len(keys), *keys) + struct.pack("=%dH" % len(values), *values))
+    if path == TABLE_FILE: _table = None  # reload on the next lookup
+
+# File Format
+# [magic(8byte)][version][byte order mark][entry num][nb_simulation (0 if exact)]
+# [keys in ascending order (uint32 x entry num)][win rate * 65535 (uint16 x entry num)]
+_FILE_MAGIC = b"PPFLOPEQ"
+_FILE_HEADER = struct.Struct("=8sIIII")
+_BYTE_ORDER_MARK = 0x01020304
+
+# loaded table ({} if the file is missing, None if not tried yet)
+_table = None
+
+def _fetch_table():
+    if _table is None: load_flop_equity_table()
+    return bool(_table)
+
+# Return (entry num, nb_simulation), None if the file is unusable
+def _parse_header(buf):
+    if len(buf) < _FILE_HEADER.size: return None
+    magic, version, byte_order_mark, entry_num, nb_simulation = _FILE_HEADER.unpack_from(buf)
+    if magic != _FILE_MAGIC or version != TABLE_VERSION or byte_order_mark != _BYTE_ORDER_MARK: return None
+    if len(buf) != _FILE_HEADER.size + calc_arrays_size(_gen_layout(entry_num)): return None
+    return entry_num, nb_simulation
+
+def _gen_layout(entry_num):
+    return [("I", entry_num), ("H", entry_num)]
+
+def _pack_key(hole_ids, flop_ids):
+    key = 0
+    for card_id in tuple(hole_ids) + tuple(flop_ids): key = key << 6 | card_id
+    return key
@@ -81,11 +81,8 @@ def _restore_community_card_on_table(table, card_data):
         table.add_community_card(Card.from_str(str_card))
 
 def _restore_deck(str_exclude_cards):
-    deck = Deck()
     exclude_ids = [Card.to_id(Card.from_str(s)) for s in str_exclude_cards]
-    deck_cards = [Card.from_id(cid) for cid in range(1, 53) if cid not in exclude_ids]
-    deck.deck = deck_cards
-    return deck
+    return Deck(deck_ids=[cid for cid in range(1, 53) if cid not in exclude_ids])
 
 def _restore_seats(seats_info, action_histories):
     players = [Player(info["uuid"], info["stack"], info["name"]) for info in seats_info]
@@ -0,0 +1,63 @@
+import numpy as np
+
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+AHEAD, TIED, BEHIND = 0, 1, 2
+
+# Hand strength and one card look-ahead hand potential of hole_card against
+# one random opponent (Billings et al.). Every opponent hole card and next
+# community card is enumerated and scored with HandEvaluator.eval_hand_batch.
+#
+# Return Format
+#   hand_strength : P(ahead now) + P(tied now) / 2
+#   ppot          : P(ahead after next card | behind or tied now)
+#   npot          : P(behind after next card | ahead or tied now)
+#   ehs           : hand_strength * (1 - npot) + (1 - hand_strength) * ppot
+def calc_hand_potential(hole_card, community_card):
+    assert len(hole_card) == 2 and 3 <= len(community_card) <= 5
+    hole_ids = np.array([[card.to_id() for card in hole_card]])
+    board_ids = np.array([[card.to_id() for card in community_card]])
+    unseen_ids = np.setdiff1d(np.arange(1, 53), np.concatenate([hole_ids[0], board_ids[0]]))
+    opp_ids = _gen_combinations(unseen_ids)
+
+    my_score = HandEvaluator.eval_hand_batch(hole_ids, board_ids)[0]
+    opp_score = HandEvaluator.eval_hand_batch(opp_ids, board_ids)
+    now = _compare(my_score, opp_score)
+    counts = np.bincount(now, minlength=3)
+    hand_strength = (counts[AHEAD] + counts[TIED] / 2.0) / len(now)
+    if len(community_card) == 5:
+        return _format_result(hand_strength, 0.0, 0.0)
+
+    # every (opponent hole card, next card) pair which does not reuse a card
+    unused = (opp_ids[:, 0, np.newaxis] != unseen_ids) & (opp_ids[:, 1, np.newaxis] != unseen_ids)
+    opp_idx, next_idx = np.nonzero(unused)
+    next_boards = np.hstack([np.repeat(board_ids, len(unseen_ids), axis=0), unseen_ids[:, np.newaxis]])
+    my_next_score = HandEvaluator.eval_hand_batch(np.repeat(hole_ids, len(unseen_ids), axis=0), next_boards)
+    opp_next_score = HandEvaluator.eval_hand_batch(opp_ids[opp_idx], next_boards[next_idx])
+    after = _compare(my_next_score[next_idx], opp_next_score)
+
+    hp = np.bincount(now[opp_idx] * 3 + after, minlength=9).reshape(3, 3).astype(float)
+    hp_total = hp.sum(axis=1)
+    ppot = _safe_div(hp[BEHIND][AHEAD] + hp[BEHIND][TIED] / 2 + hp[TIED][AHEAD] / 2,\
+            hp_total[BEHIND] + hp_total[TIED] / 2)
+    npot = _safe_div(hp[AHEAD][BEHIND] + hp[TIED][BEHIND] / 2 + hp[AHEAD][TIED] / 2,\
+            hp_total[AHEAD] + hp_total[TIED] / 2)
+    return _format_result(hand_strength, ppot, npot)
+
+def _format_result(hand_strength, ppot, npot):
+    return {
+            "hand_strength": float(hand_strength),
+            "ppot": float(ppot),
+            "npot": float(npot),
+            "ehs": float(hand_strength * (1 - npot) + (1 - hand_strength) * ppot)
+            }
+
+def _gen_combinations(card_ids):
+    first, second = np.triu_indices(len(card_ids), k=1)
+    return np.stack([card_ids[first], card_ids[second]], axis=1)
+
+def _compare(my_score, opp_score):
+    return np.where(my_score > opp_score, AHEAD, np.where(my_score == opp_score, TIED, BEHIND))
+
+def _safe_div(numerator, denominator):
+    return numerator / denominator if denominator else 0.0
@@ -0,0 +1,68 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import combinations
+
+from pypokerengine.engine.card import Card
+from pypokerengine.engine.hand_evaluator import HandEvaluator
+
+BOARD_INDEX_CACHE_SIZE = 64
+
+# Exact fraction of opponent hole cards which hole_card beats, ties and loses to.
+# Scores of all hole card combinations left on the board are sorted once per
+# board, so later queries on that board are two binary searches plus a
+# correction for the combinations which share a card with hole_card.
+def calc_hand_strength(hole_card, community_card):
+    index = _fetch_board_index(community_card)
+    my_score = HandEvaluator.eval_hand_on_board(hole_card, index["board_state"])
+    win, tie, lose = _count_results(index["sorted_scores"], my_score)
+    # remove combinations which use my cards (my own combination is removed twice)
+    id1, id2 = sorted([card.to_id() for card in hole_card])
+    card_scores, my_combo_score = index["card_scores"], index["score_map"][(id1, id2)]
+    for blocked_scores, sign in [(card_scores[id1], -1), (card_scores[id2], -1), ([my_combo_score], 1)]:
+        blocked_win, blocked_tie, blocked_lose = _count_results(blocked_scores, my_score)
+        win, tie, lose = win + sign * blocked_win, tie + sign * blocked_tie, lose + sign * blocked_lose
+    total = 1.0 * (win + tie + lose)
+    return { "win": win / total, "tie": tie / total, "lose": lose / total }
+
+def clear_board_index_cache():
+    _board_index_cache.clear()
+
+_board_index_cache = OrderedDict()
+
+def _count_results(sorted_scores, my_score):
+    win = bisect_left(sorted_scores, my_score)
+    lose = len(sorted_scores) - bisect_right(sorted_scores, my_score)
+    return win, len(sorted_scores) - win - lose, lose
+
+def _fetch_board_index(community_card):
+    key = tuple(sorted([card.to_id() for card in community_card]))
+    if key in _board_index_cache:
+        index = _board_index_cache.pop(key)
+    else:
+        index = _gen_board_index(community_card)
+        if len(_board_index_cache) >= BOARD_INDEX_CACHE_SIZE:
+            _board_index_cache.popitem(last=False)
+    _board_index_cache[key] = index
+    return index
+
+# sorted_scores : scores of all hole card combinations left on the board
+# card_scores   : card id => sorted scores of the combinations using the card
+# score_map     : (card id, card id) => score of the combination
+def _gen_board_index(community_card):
+    board_state = HandEvaluator.gen_board_state(community_card)
+    used = [card.to_id() for card in community_card]
+    unused = [Card.from_id(card_id) for card_id in range(1, 53) if card_id not in used]
+    score_map, card_scores = {}, dict([(card.to_id(), []) for card in unused])
+    for hole in combinations(unused, 2):
+        combo = (hole[0].to_id(), hole[1].to_id())
+        score = HandEvaluator.eval_hand_on_board(list(hole), board_state)
+        score_map[combo] = score
+        card_scores[combo[0]].append(score)
+        card_scores[combo[1]].append(score)
+    for scores in card_scores.values(): scores.sort()
+    return {
+            "board_state": board_state,
+            "sorted_scores": sorted(score_map.values()),
+            "card_scores": card_scores,
+            "score_map": score_map
+            }
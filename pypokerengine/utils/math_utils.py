@@ -0,0 +1,5 @@
+# Number of ways to choose k of n items (math.comb is not in python 2)
+def comb(n, k):
+    count = 1
+    for i in range(k): count = count * (n - i) // (i + 1)
+    return count
@@ -0,0 +1,173 @@
+# Generated by gen_preflop_equity_table.py (200000 simulations per entry, seed 0). Do not edit.
+# hand class => win rate against 1 to 9 random opponents
+PREFLOP_WIN_RATE = {
+    "AA": (0.8571, 0.7416, 0.6500, 0.5674, 0.4998, 0.4442, 0.4002, 0.3561, 0.3221),
+    "AKs": (0.6807, 0.5210, 0.4319, 0.3717, 0.3294, 0.2944, 0.2682, 0.2440, 0.2228),
+    "AKo": (0.6645, 0.4967, 0.4005, 0.3401, 0.2984, 0.2621, 0.2351, 0.2104, 0.1909),
+    "AQs": (0.6727, 0.5088, 0.4178, 0.3540, 0.3102, 0.2779, 0.2518, 0.2294, 0.2116),
+    "AQo": (0.6565, 0.4806, 0.3843, 0.3212, 0.2772, 0.2452, 0.2154, 0.1932, 0.1745),
+    "AJs": (0.6664, 0.4979, 0.4019, 0.3410, 0.2958, 0.2651, 0.2374, 0.2171, 0.1984),
+    "AJo": (0.6460, 0.4713, 0.3727, 0.3073, 0.2631, 0.2303, 0.2054, 0.1820, 0.1631),
+    "ATs": (0.6596, 0.4858, 0.3902, 0.3295, 0.2858, 0.2549, 0.2288, 0.2094, 0.1923),
+    "ATo": (0.6392, 0.4604, 0.3601, 0.2961, 0.2513, 0.2207, 0.1927, 0.1706, 0.1546),
+    "A9s": (0.6393, 0.4602, 0.3629, 0.2999, 0.2587, 0.2280, 0.2033, 0.1859, 0.1693),
+    "A9o": (0.6193, 0.4324, 0.3309, 0.2653, 0.2209, 0.1891, 0.1693, 0.1475, 0.1311),
+    "A8s": (0.6311, 0.4502, 0.3530, 0.2914, 0.2493, 0.2189, 0.1964, 0.1768, 0.1631),
+    "A8o": (0.6128, 0.4227, 0.3199, 0.2563, 0.2133, 0.1802, 0.1591, 0.1407, 0.1247),
+    "A7s": (0.6217, 0.4381, 0.3379, 0.2776, 0.2410, 0.2096, 0.1891, 0.1715, 0.1565),
+    "A7o": (0.6015, 0.4104, 0.3072, 0.2435, 0.2030, 0.1729, 0.1504, 0.1323, 0.1179),
+    "A6s": (0.6123, 0.4249, 0.3283, 0.2678, 0.2290, 0.2026, 0.1816, 0.1633, 0.1508),
+    "A6o": (0.5915, 0.3962, 0.2921, 0.2326, 0.1931, 0.1637, 0.1439, 0.1254, 0.1114),
+    "A5s": (0.5994, 0.4140, 0.3155, 0.2579, 0.2197, 0.1930, 0.1728, 0.1583, 0.1445),
+    "A5o": (0.5758, 0.3852, 0.2801, 0.2227, 0.1828, 0.1562, 0.1344, 0.1185, 0.1051),
+    "A4s": (0.5872, 0.4010, 0.3037, 0.2463, 0.2115, 0.1863, 0.1656, 0.1514, 0.1386),
+    "A4o": (0.5637, 0.3688, 0.2689, 0.2099, 0.1730, 0.1467, 0.1262, 0.1110, 0.0978),
+    "A3s": (0.5752, 0.3855, 0.2919, 0.2376, 0.2025, 0.1778, 0.1587, 0.1424, 0.1326),
+    "A3o": (0.5506, 0.3525, 0.2548, 0.1985, 0.1626, 0.1379, 0.1187, 0.1038, 0.0916),
+    "A2s": (0.5600, 0.3701, 0.2799, 0.2280, 0.1936, 0.1724, 0.1524, 0.1384, 0.1268),
+    "A2o": (0.5360, 0.3394, 0.2431, 0.1890, 0.1539, 0.1300, 0.1129, 0.0983, 0.0878),
+    "KK": (0.8311, 0.6983, 0.5912, 0.5086, 0.4399, 0.3811, 0.3383, 0.3000, 0.2662),
+    "KQs": (0.6461, 0.4868, 0.3977, 0.3382, 0.2956, 0.2634, 0.2378, 0.2148, 0.1971),
+    "KQo": (0.6261, 0.4578, 0.3659, 0.3064, 0.2610, 0.2304, 0.2014, 0.1825, 0.1634),
+    "KJs": (0.6383, 0.4731, 0.3819, 0.3240, 0.2830, 0.2514, 0.2248, 0.2052, 0.1861),
+    "KJo": (0.6179, 0.4446, 0.3515, 0.2910, 0.2489, 0.2142, 0.1902, 0.1699, 0.1504),
+    "KTs": (0.6311, 0.4626, 0.3703, 0.3132, 0.2714, 0.2393, 0.2167, 0.1962, 0.1798),
+    "KTo": (0.6110, 0.4351, 0.3402, 0.2784, 0.2353, 0.2065, 0.1799, 0.1608, 0.1450),
+    "K9s": (0.6127, 0.4375, 0.3423, 0.2850, 0.2451, 0.2148, 0.1907, 0.1729, 0.1573),
+    "K9o": (0.5929, 0.4080, 0.3094, 0.2483, 0.2081, 0.1781, 0.1530, 0.1352, 0.1199),
+    "K8s": (0.5969, 0.4180, 0.3191, 0.2636, 0.2246, 0.1960, 0.1751, 0.1573, 0.1441),
+    "K8o": (0.5769, 0.3821, 0.2856, 0.2272, 0.1864, 0.1588, 0.1342, 0.1187, 0.1045),
+    "K7s": (0.5875, 0.4077, 0.3101, 0.2542, 0.2167, 0.1890, 0.1673, 0.1538, 0.1393),
+    "K7o": (0.5660, 0.3756, 0.2745, 0.2161, 0.1796, 0.1496, 0.1305, 0.1128, 0.0993),
+    "K6s": (0.5780, 0.3942, 0.2987, 0.2447, 0.2074, 0.1823, 0.1617, 0.1469, 0.1333),
+    "K6o": (0.5581, 0.3617, 0.2647, 0.2063, 0.1692, 0.1434, 0.1222, 0.1056, 0.0933),
+    "K5s": (0.5641, 0.3817, 0.2878, 0.2355, 0.1991, 0.1738, 0.1547, 0.1406, 0.1278),
+    "K5o": (0.5429, 0.3473, 0.2530, 0.1969, 0.1604, 0.1342, 0.1148, 0.1007, 0.0880),
+    "K4s": (0.5533, 0.3676, 0.2778, 0.2265, 0.1905, 0.1680, 0.1490, 0.1342, 0.1233),
+    "K4o": (0.5288, 0.3349, 0.2407, 0.1860, 0.1522, 0.1267, 0.1095, 0.0940, 0.0815),
+    "K3s": (0.5416, 0.3557, 0.2651, 0.2145, 0.1828, 0.1585, 0.1413, 0.1283, 0.1171),
+    "K3o": (0.5156, 0.3198, 0.2293, 0.1762, 0.1426, 0.1188, 0.1012, 0.0880, 0.0783),
+    "K2s": (0.5277, 0.3427, 0.2546, 0.2067, 0.1753, 0.1536, 0.1372, 0.1236, 0.1128),
+    "K2o": (0.5031, 0.3101, 0.2173, 0.1670, 0.1355, 0.1104, 0.0955, 0.0840, 0.0728),
+    "QQ": (0.8047, 0.6585, 0.5447, 0.4554, 0.3845, 0.3329, 0.2900, 0.2538, 0.2277),
+    "QJs": (0.6158, 0.4551, 0.3701, 0.3142, 0.2734, 0.2445, 0.2189, 0.1982, 0.1829),
+    "QJo": (0.5932, 0.4256, 0.3388, 0.2800, 0.2399, 0.2077, 0.1843, 0.1631, 0.1464),
+    "QTs": (0.6094, 0.4451, 0.3570, 0.3033, 0.2643, 0.2337, 0.2101, 0.1912, 0.1749),
+    "QTo": (0.5872, 0.4139, 0.3257, 0.2663, 0.2276, 0.1985, 0.1740, 0.1538, 0.1384),
+    "Q9s": (0.5906, 0.4195, 0.3303, 0.2757, 0.2361, 0.2077, 0.1855, 0.1681, 0.1527),
+    "Q9o": (0.5672, 0.3882, 0.2955, 0.2401, 0.1982, 0.1703, 0.1462, 0.1292, 0.1148),
+    "Q8s": (0.5743, 0.3966, 0.3077, 0.2534, 0.2158, 0.1884, 0.1678, 0.1517, 0.1385),
+    "Q8o": (0.5508, 0.3667, 0.2727, 0.2160, 0.1764, 0.1503, 0.1299, 0.1123, 0.0995),
+    "Q7s": (0.5564, 0.3755, 0.2858, 0.2337, 0.1966, 0.1719, 0.1537, 0.1391, 0.1261),
+    "Q7o": (0.5326, 0.3442, 0.2490, 0.1973, 0.1588, 0.1347, 0.1136, 0.0985, 0.0867),
+    "Q6s": (0.5450, 0.3685, 0.2798, 0.2242, 0.1895, 0.1666, 0.1476, 0.1328, 0.1199),
+    "Q6o": (0.5245, 0.3335, 0.2395, 0.1869, 0.1515, 0.1264, 0.1069, 0.0942, 0.0821),
+    "Q5s": (0.5323, 0.3551, 0.2663, 0.2157, 0.1843, 0.1595, 0.1417, 0.1276, 0.1170),
+    "Q5o": (0.5107, 0.3222, 0.2289, 0.1780, 0.1427, 0.1185, 0.1001, 0.0872, 0.0775),
+    "Q4s": (0.5231, 0.3434, 0.2582, 0.2067, 0.1744, 0.1525, 0.1355, 0.1213, 0.1128),
+    "Q4o": (0.4964, 0.3089, 0.2181, 0.1671, 0.1360, 0.1109, 0.0940, 0.0820, 0.0725),
+    "Q3s": (0.5117, 0.3301, 0.2436, 0.1985, 0.1670, 0.1464, 0.1304, 0.1182, 0.1071),
+    "Q3o": (0.4830, 0.2947, 0.2086, 0.1591, 0.1272, 0.1050, 0.0889, 0.0765, 0.0679),
+    "Q2s": (0.4965, 0.3184, 0.2359, 0.1896, 0.1613, 0.1397, 0.1234, 0.1140, 0.1047),
+    "Q2o": (0.4677, 0.2812, 0.1968, 0.1511, 0.1206, 0.1010, 0.0837, 0.0715, 0.0633),
+    "JJ": (0.7814, 0.6182, 0.5001, 0.4102, 0.3436, 0.2896, 0.2537, 0.2206, 0.1977),
+    "JTs": (0.5882, 0.4325, 0.3500, 0.2959, 0.2561, 0.2296, 0.2076, 0.1895, 0.1743),
+    "JTo": (0.5650, 0.4016, 0.3166, 0.2615, 0.2253, 0.1951, 0.1724, 0.1552, 0.1389),
+    "J9s": (0.5702, 0.4075, 0.3225, 0.2710, 0.2327, 0.2059, 0.1824, 0.1669, 0.1532),
+    "J9o": (0.5456, 0.3753, 0.2891, 0.2345, 0.1953, 0.1663, 0.1457, 0.1299, 0.1156),
+    "J8s": (0.5536, 0.3854, 0.2991, 0.2479, 0.2124, 0.1868, 0.1663, 0.1498, 0.1380),
+    "J8o": (0.5304, 0.3534, 0.2656, 0.2101, 0.1741, 0.1489, 0.1287, 0.1117, 0.1013),
+    "J7s": (0.5374, 0.3646, 0.2793, 0.2278, 0.1948, 0.1689, 0.1508, 0.1356, 0.1259),
+    "J7o": (0.5118, 0.3300, 0.2413, 0.1904, 0.1564, 0.1293, 0.1119, 0.0970, 0.0855),
+    "J6s": (0.5187, 0.3393, 0.2582, 0.2089, 0.1769, 0.1535, 0.1363, 0.1240, 0.1109),
+    "J6o": (0.4887, 0.3072, 0.2193, 0.1700, 0.1369, 0.1137, 0.0963, 0.0832, 0.0724),
+    "J5s": (0.5078, 0.3314, 0.2508, 0.2027, 0.1691, 0.1487, 0.1312, 0.1181, 0.1081),
+    "J5o": (0.4787, 0.2945, 0.2120, 0.1626, 0.1305, 0.1069, 0.0900, 0.0779, 0.0679),
+    "J4s": (0.4936, 0.3202, 0.2396, 0.1939, 0.1638, 0.1402, 0.1252, 0.1127, 0.1036),
+    "J4o": (0.4638, 0.2843, 0.2010, 0.1529, 0.1227, 0.1006, 0.0861, 0.0734, 0.0636),
+    "J3s": (0.4821, 0.3089, 0.2297, 0.1865, 0.1562, 0.1351, 0.1200, 0.1118, 0.1013),
+    "J3o": (0.4527, 0.2744, 0.1900, 0.1449, 0.1147, 0.0945, 0.0803, 0.0678, 0.0597),
+    "J2s": (0.4696, 0.2960, 0.2194, 0.1769, 0.1489, 0.1302, 0.1174, 0.1041, 0.0969),
+    "J2o": (0.4383, 0.2581, 0.1823, 0.1356, 0.1100, 0.0893, 0.0747, 0.0642, 0.0560),
+    "TT": (0.7525, 0.5812, 0.4567, 0.3694, 0.3018, 0.2553, 0.2204, 0.1958, 0.1751),
+    "T9s": (0.5535, 0.3982, 0.3184, 0.2688, 0.2319, 0.2061, 0.1848, 0.1685, 0.1563),
+    "T9o": (0.5271, 0.3644, 0.2838, 0.2339, 0.1964, 0.1671, 0.1474, 0.1310, 0.1194),
+    "T8s": (0.5364, 0.3758, 0.2954, 0.2467, 0.2128, 0.1870, 0.1691, 0.1547, 0.1414),
+    "T8o": (0.5115, 0.3431, 0.2608, 0.2099, 0.1746, 0.1502, 0.1295, 0.1154, 0.1039),
+    "T7s": (0.5188, 0.3548, 0.2758, 0.2276, 0.1931, 0.1695, 0.1526, 0.1392, 0.1272),
+    "T7o": (0.4918, 0.3204, 0.2387, 0.1898, 0.1552, 0.1317, 0.1146, 0.0998, 0.0895),
+    "T6s": (0.5002, 0.3337, 0.2547, 0.2061, 0.1774, 0.1530, 0.1364, 0.1244, 0.1134),
+    "T6o": (0.4741, 0.2978, 0.2166, 0.1686, 0.1366, 0.1143, 0.0975, 0.0843, 0.0752),
+    "T5s": (0.4788, 0.3115, 0.2333, 0.1898, 0.1597, 0.1382, 0.1246, 0.1102, 0.1015),
+    "T5o": (0.4471, 0.2752, 0.1959, 0.1486, 0.1186, 0.0982, 0.0813, 0.0728, 0.0628),
+    "T4s": (0.4682, 0.3029, 0.2245, 0.1833, 0.1544, 0.1340, 0.1195, 0.1064, 0.0980),
+    "T4o": (0.4380, 0.2647, 0.1862, 0.1420, 0.1132, 0.0920, 0.0773, 0.0668, 0.0586),
+    "T3s": (0.4566, 0.2924, 0.2176, 0.1756, 0.1481, 0.1291, 0.1130, 0.1033, 0.0937),
+    "T3o": (0.4252, 0.2525, 0.1763, 0.1328, 0.1055, 0.0882, 0.0725, 0.0623, 0.0539),
+    "T2s": (0.4405, 0.2795, 0.2080, 0.1671, 0.1409, 0.1221, 0.1104, 0.1004, 0.0912),
+    "T2o": (0.4104, 0.2403, 0.1656, 0.1266, 0.0993, 0.0808, 0.0681, 0.0594, 0.0518),
+    "99": (0.7251, 0.5412, 0.4161, 0.3296, 0.2698, 0.2267, 0.1961, 0.1732, 0.1590),
+    "98s": (0.5193, 0.3695, 0.2916, 0.2410, 0.2084, 0.1841, 0.1657, 0.1506, 0.1382),
+    "98o": (0.4929, 0.3344, 0.2551, 0.2069, 0.1714, 0.1460, 0.1267, 0.1133, 0.1016),
+    "97s": (0.5046, 0.3496, 0.2719, 0.2242, 0.1939, 0.1698, 0.1513, 0.1391, 0.1276),
+    "97o": (0.4741, 0.3121, 0.2340, 0.1872, 0.1551, 0.1308, 0.1130, 0.1017, 0.0916),
+    "96s": (0.4856, 0.3278, 0.2529, 0.2058, 0.1767, 0.1545, 0.1365, 0.1255, 0.1141),
+    "96o": (0.4545, 0.2905, 0.2121, 0.1685, 0.1363, 0.1142, 0.0990, 0.0870, 0.0775),
+    "95s": (0.4637, 0.3045, 0.2317, 0.1871, 0.1590, 0.1381, 0.1251, 0.1128, 0.1017),
+    "95o": (0.4313, 0.2701, 0.1917, 0.1483, 0.1194, 0.0981, 0.0840, 0.0739, 0.0654),
+    "94s": (0.4423, 0.2817, 0.2112, 0.1708, 0.1447, 0.1243, 0.1112, 0.1003, 0.0911),
+    "94o": (0.4092, 0.2439, 0.1717, 0.1297, 0.1022, 0.0848, 0.0712, 0.0612, 0.0534),
+    "93s": (0.4319, 0.2753, 0.2065, 0.1652, 0.1371, 0.1198, 0.1069, 0.0970, 0.0889),
+    "93o": (0.3992, 0.2348, 0.1628, 0.1232, 0.0965, 0.0780, 0.0663, 0.0564, 0.0501),
+    "92s": (0.4188, 0.2631, 0.1960, 0.1570, 0.1341, 0.1176, 0.1029, 0.0938, 0.0866),
+    "92o": (0.3843, 0.2232, 0.1540, 0.1161, 0.0912, 0.0735, 0.0640, 0.0536, 0.0485),
+    "88": (0.6949, 0.5011, 0.3784, 0.2979, 0.2418, 0.2039, 0.1792, 0.1589, 0.1448),
+    "87s": (0.4897, 0.3422, 0.2710, 0.2244, 0.1935, 0.1695, 0.1531, 0.1404, 0.1293),
+    "87o": (0.4619, 0.3077, 0.2337, 0.1861, 0.1553, 0.1343, 0.1163, 0.1030, 0.0951),
+    "86s": (0.4712, 0.3218, 0.2525, 0.2079, 0.1786, 0.1583, 0.1406, 0.1291, 0.1189),
+    "86o": (0.4410, 0.2893, 0.2129, 0.1683, 0.1375, 0.1190, 0.1044, 0.0919, 0.0841),
+    "85s": (0.4532, 0.3043, 0.2333, 0.1893, 0.1631, 0.1426, 0.1279, 0.1186, 0.1090),
+    "85o": (0.4203, 0.2638, 0.1935, 0.1509, 0.1215, 0.1041, 0.0896, 0.0787, 0.0702),
+    "84s": (0.4304, 0.2786, 0.2119, 0.1720, 0.1469, 0.1284, 0.1150, 0.1035, 0.0957),
+    "84o": (0.3959, 0.2398, 0.1716, 0.1312, 0.1057, 0.0882, 0.0750, 0.0662, 0.0590),
+    "83s": (0.4054, 0.2599, 0.1936, 0.1562, 0.1314, 0.1151, 0.1026, 0.0935, 0.0860),
+    "83o": (0.3728, 0.2179, 0.1519, 0.1142, 0.0895, 0.0729, 0.0610, 0.0540, 0.0469),
+    "82s": (0.3955, 0.2510, 0.1871, 0.1502, 0.1280, 0.1116, 0.0998, 0.0899, 0.0824),
+    "82o": (0.3617, 0.2112, 0.1439, 0.1082, 0.0854, 0.0705, 0.0592, 0.0507, 0.0451),
+    "77": (0.6651, 0.4670, 0.3469, 0.2700, 0.2187, 0.1862, 0.1640, 0.1501, 0.1377),
+    "76s": (0.4635, 0.3203, 0.2528, 0.2101, 0.1806, 0.1609, 0.1461, 0.1333, 0.1242),
+    "76o": (0.4322, 0.2846, 0.2132, 0.1695, 0.1411, 0.1218, 0.1079, 0.0968, 0.0892),
+    "75s": (0.4402, 0.3030, 0.2343, 0.1929, 0.1659, 0.1469, 0.1337, 0.1217, 0.1139),
+    "75o": (0.4102, 0.2642, 0.1954, 0.1551, 0.1265, 0.1091, 0.0967, 0.0865, 0.0791),
+    "74s": (0.4194, 0.2813, 0.2164, 0.1776, 0.1525, 0.1337, 0.1199, 0.1106, 0.1025),
+    "74o": (0.3861, 0.2429, 0.1744, 0.1352, 0.1106, 0.0929, 0.0819, 0.0734, 0.0664),
+    "73s": (0.3974, 0.2588, 0.1961, 0.1585, 0.1354, 0.1196, 0.1071, 0.0985, 0.0917),
+    "73o": (0.3629, 0.2188, 0.1538, 0.1171, 0.0951, 0.0788, 0.0681, 0.0605, 0.0539),
+    "72s": (0.3725, 0.2367, 0.1779, 0.1425, 0.1219, 0.1056, 0.0958, 0.0883, 0.0811),
+    "72o": (0.3374, 0.1981, 0.1359, 0.1006, 0.0793, 0.0665, 0.0557, 0.0488, 0.0429),
+    "66": (0.6334, 0.4347, 0.3164, 0.2467, 0.2020, 0.1723, 0.1533, 0.1395, 0.1285),
+    "65s": (0.4367, 0.3027, 0.2356, 0.1969, 0.1706, 0.1523, 0.1379, 0.1281, 0.1175),
+    "65o": (0.4040, 0.2678, 0.1979, 0.1572, 0.1314, 0.1142, 0.1013, 0.0906, 0.0846),
+    "64s": (0.4140, 0.2824, 0.2205, 0.1820, 0.1579, 0.1399, 0.1292, 0.1171, 0.1089),
+    "64o": (0.3803, 0.2454, 0.1814, 0.1425, 0.1167, 0.1003, 0.0899, 0.0818, 0.0740),
+    "63s": (0.3896, 0.2611, 0.2021, 0.1661, 0.1429, 0.1260, 0.1151, 0.1055, 0.0987),
+    "63o": (0.3560, 0.2221, 0.1600, 0.1238, 0.1034, 0.0872, 0.0764, 0.0682, 0.0631),
+    "62s": (0.3701, 0.2415, 0.1830, 0.1494, 0.1286, 0.1136, 0.1028, 0.0945, 0.0864),
+    "62o": (0.3322, 0.2004, 0.1404, 0.1056, 0.0867, 0.0721, 0.0630, 0.0573, 0.0502),
+    "55": (0.5975, 0.3971, 0.2882, 0.2219, 0.1847, 0.1608, 0.1439, 0.1344, 0.1255),
+    "54s": (0.3980, 0.2713, 0.2103, 0.1726, 0.1509, 0.1338, 0.1216, 0.1118, 0.1045),
+    "54o": (0.3619, 0.2332, 0.1710, 0.1335, 0.1102, 0.0959, 0.0835, 0.0747, 0.0706),
+    "53s": (0.3768, 0.2541, 0.1947, 0.1612, 0.1374, 0.1227, 0.1122, 0.1028, 0.0958),
+    "53o": (0.3378, 0.2140, 0.1516, 0.1180, 0.0966, 0.0833, 0.0727, 0.0661, 0.0600),
+    "52s": (0.3508, 0.2334, 0.1759, 0.1444, 0.1241, 0.1103, 0.0999, 0.0924, 0.0858),
+    "52o": (0.3127, 0.1914, 0.1337, 0.1022, 0.0832, 0.0694, 0.0601, 0.0540, 0.0486),
+    "44": (0.5649, 0.3628, 0.2581, 0.2039, 0.1727, 0.1538, 0.1387, 0.1319, 0.1225),
+    "43s": (0.3589, 0.2419, 0.1860, 0.1523, 0.1325, 0.1154, 0.1072, 0.0984, 0.0901),
+    "43o": (0.3226, 0.2023, 0.1434, 0.1108, 0.0909, 0.0774, 0.0666, 0.0609, 0.0556),
+    "42s": (0.3363, 0.2231, 0.1691, 0.1392, 0.1205, 0.1067, 0.0975, 0.0894, 0.0839),
+    "42o": (0.2987, 0.1809, 0.1268, 0.0954, 0.0791, 0.0659, 0.0586, 0.0527, 0.0468),
+    "33": (0.5285, 0.3311, 0.2386, 0.1890, 0.1621, 0.1460, 0.1372, 0.1285, 0.1232),
+    "32s": (0.3232, 0.2146, 0.1631, 0.1334, 0.1140, 0.1036, 0.0955, 0.0861, 0.0805),
+    "32o": (0.2840, 0.1729, 0.1196, 0.0894, 0.0741, 0.0627, 0.0542, 0.0477, 0.0439),
+    "22": (0.4926, 0.3026, 0.2184, 0.1776, 0.1559, 0.1446, 0.1343, 0.1285, 0.1233),
+}
@@ -0,0 +1,35 @@
+from pypokerengine.engine.card import Card
+from pypokerengine.utils.preflop_equity_table import PREFLOP_WIN_RATE
+
+# Preflop win rate (as estimate_hole_card_win_rate) of the 169 hand classes
+# against 1 to MAX_OPPONENT_NUM random opponents. The table is generated
+# offline by gen_preflop_equity_table.py.
+#
+# Hand class : "AA" (pair), "AKs" (suited), "AKo" (offsuit), higher rank first
+
+MAX_OPPONENT_NUM = 9
+
+RANK_CHARS = "23456789TJQKA"
+
+def lookup_preflop_win_rate(hole_card, nb_player):
+    win_rates = PREFLOP_WIN_RATE.get(gen_hand_class(hole_card))
+    if win_rates is None or not 1 <= nb_player - 1 <= len(win_rates): return None
+    return win_rates[nb_player - 2]
+
+def gen_hand_class(hole_card):
+    high, low = sorted(hole_card, key=lambda card: card.rank, reverse=True)
+    ranks = Card.RANK_MAP[high.rank] + Card.RANK_MAP[low.rank]
+    if high.rank == low.rank: return ranks
+    return ranks + ("s" if high.suit == low.suit else "o")
+
+def gen_all_hand_classes():
+    classes = []
+    for high in reversed(RANK_CHARS):
+        for low in reversed(RANK_CHARS[:RANK_CHARS.index(high) + 1]):
+            classes += [high + low] if high == low else [high + low + "s", high + low + "o"]
+    return classes
+
+# Hole cards of a hand class (spade and heart cards)
+def gen_class_hole_card(hand_class):
+    suited = hand_class[2:] == "s"
+    return [Card.from_str("S" + hand_class[0]), Card.from_str(("S" if suited else "H") + hand_class[1])]
@@ -0,0 +1,34 @@
+import random
+import hashlib
+from numbers import Integral
+
+# Random number streams of the engine.
+#
+# Every place which draws random numbers (deck shuffle, uuid generation,
+# monte carlo sampling) accepts a "seed" which is one of
+#   None          : the global random module (unseeded behaviour)
+#   int           : a new random.Random seeded with it
+#   random object : used as is (random.Random or anything with its methods)
+#
+# Independent child streams are derived with spawn_rng. A child of an int
+# seed depends only on the seed and the keys, so game i of a match or worker
+# j of a pool gets the same stream however the work is scheduled:
+#
+#   spawn_rng(seed, i)               # stream of game i
+#   spawn_rng(seed, "worker", j)     # stream of worker j
+#   spawn_rng(seed, i, "deck")       # deck stream inside game i
+
+def gen_rng(seed=None):
+    if seed is None: return random
+    if isinstance(seed, Integral): return random.Random(seed)
+    return seed
+
+def derive_seed(seed, *keys):
+    data = repr((int(seed),) + keys).encode("utf-8")
+    return int(hashlib.sha256(data).hexdigest()[:16], 16)
+
+def spawn_rng(seed, *keys):
+    if isinstance(seed, Integral):
+        return random.Random(derive_seed(seed, *keys))
+    # a child of a random object is seeded from its stream
+    return random.Random(gen_rng(seed).getrandbits(64))
@@ -5,9 +5,13 @@ import game
 
 setup_config = game.setup_config
 start_poker = game.start_poker
+import os
+import math
 import time
 from argparse import ArgumentParser
 
+from pypokerengine.utils.deal_schedule_utils import gen_deal_schedule, gen_schedule_deck, save_deal_schedule, load_deal_schedule
+
 """ =========== *Remember to import your agent!!! =========== """
 from randomplayer import RandomPlayer
 
@@ -17,10 +21,17 @@ from randomplayer import RandomPlayer
 """ Example---To run testperf.py with random warrior AI against itself. 
 
 $ python testperf.py -n1 "Random Warrior 1" -a1 RandomPlayer -n2 "Random Warrior 2" -a2 RandomPlayer
+
+Add "-s 42" to deal the same cards in every run (game i is dealt from its own stream of the seed).
+
+Example---To play 100 duplicate games (each game is played twice with the seats swapped and the same cards).
+The deal schedule is generated into deals.bin on the first run and reused after that.
+
+$ python testperf.py -n1 "Random Warrior 1" -n2 "Random Warrior 2" -d -g 100 -f deals.bin
 """
 
 
-def testperf(agent_name1, agent1, agent_name2, agent2):
+def testperf(agent_name1, agent1, agent_name2, agent2, seed=None):
     # Init to play 500 games of 1000 rounds
     num_game = 500
     max_round = 1000
@@ -32,7 +43,7 @@ def testperf(agent_name1, agent1, agent_name2, agent2):
     agent2_pot = 0
 
     # Setting configuration
-    config = setup_config(max_round=max_round, initial_stack=initial_stack, small_blind_amount=smallblind_amount)
+    config = setup_config(max_round=max_round, initial_stack=initial_stack, small_blind_amount=smallblind_amount, seed=seed)
 
     # Register players
     config.register_player(name=agent_name1, algorithm=RandomPlayer())
@@ -65,20 +76,77 @@ def testperf(agent_name1, agent1, agent_name2, agent2):
         Print("\n It's a draw!")
 
 
+def testperf_duplicate(agent_name1, agent_name2, num_game, schedule_path=None, seed=None):
+    max_round = 1000
+    initial_stack = 10000
+    smallblind_amount = 20
+
+    schedule = fetch_deal_schedule(schedule_path, num_game, max_round, seed)
+
+    # Agent 1 sits first in the config A and second in the config B
+    config_a = setup_config(max_round=max_round, initial_stack=initial_stack, small_blind_amount=smallblind_amount)
+    config_a.register_player(name=agent_name1, algorithm=RandomPlayer())
+    config_a.register_player(name=agent_name2, algorithm=RandomPlayer())
+    config_b = setup_config(max_round=max_round, initial_stack=initial_stack, small_blind_amount=smallblind_amount)
+    config_b.register_player(name=agent_name2, algorithm=RandomPlayer())
+    config_b.register_player(name=agent_name1, algorithm=RandomPlayer())
+
+    # Paired difference of a game : agent 1's stack minus agent 2's stack, summed over both seatings
+    diffs = []
+    for game in range(num_game):
+        print("Game number: ", game + 1)
+        result_a = start_poker(config_a, verbose=0, cheat_deck=gen_schedule_deck(schedule, game))
+        result_b = start_poker(config_b, verbose=0, cheat_deck=gen_schedule_deck(schedule, game))
+        stacks_a = [player['stack'] for player in result_a['players']]
+        stacks_b = [player['stack'] for player in result_b['players']]
+        diffs.append((stacks_a[0] - stacks_a[1]) + (stacks_b[1] - stacks_b[0]))
+
+    mean = 1.0 * sum(diffs) / num_game
+    variance = sum([(diff - mean) ** 2 for diff in diffs]) / (num_game - 1) if num_game > 1 else 0.0
+    std_error = math.sqrt(variance / num_game)
+    print("\n After playing {} duplicate games of {} rounds, the results are: ".format(num_game, max_round))
+    print("\n Mean paired difference (" + agent_name1 + " - " + agent_name2 + "): %.2f" % mean)
+    print("\n Standard error: %.2f (95%% interval %.2f to %.2f)" % (std_error, mean - 1.96 * std_error, mean + 1.96 * std_error))
+
+    if mean - 1.96 * std_error > 0:
+        print("\n Congratulations! " + agent_name1 + " has won.")
+    elif mean + 1.96 * std_error < 0:
+        print("\n Congratulations! " + agent_name2 + " has won.")
+    else:
+        print("\n No significant difference between the agents.")
+
+
+def fetch_deal_schedule(schedule_path, num_game, max_round, seed):
+    if schedule_path and os.path.exists(schedule_path):
+        schedule = load_deal_schedule(schedule_path)
+        if schedule['game_num'] < num_game or schedule['round_num'] < max_round:
+            raise ValueError("%s has only %d games of %d rounds" % (schedule_path, schedule['game_num'], schedule['round_num']))
+        return schedule
+    schedule = gen_deal_schedule(num_game, max_round, seed=seed)
+    if schedule_path: save_deal_schedule(schedule_path, schedule)
+    return schedule
+
+
 def parse_arguments():
     parser = ArgumentParser()
     parser.add_argument('-n1', '--agent_name1', help="Name of agent 1", default="Your agent", type=str)
     parser.add_argument('-a1', '--agent1', help="Agent 1", default=RandomPlayer())
     parser.add_argument('-n2', '--agent_name2', help="Name of agent 2", default="Your agent", type=str)
     parser.add_argument('-a2', '--agent2', help="Agent 2", default=RandomPlayer())
-    args = parser.parse_args()
-    return args.agent_name1, args.agent1, args.agent_name2, args.agent2
+    parser.add_argument('-s', '--seed', help="Seed of the card streams (unseeded if omitted)", default=None, type=int)
+    parser.add_argument('-d', '--duplicate', help="Play duplicate games with the seats swapped", action='store_true')
+    parser.add_argument('-g', '--num_game', help="Number of duplicate games", default=100, type=int)
+    parser.add_argument('-f', '--schedule', help="Deal schedule file (generated if missing)", default=None, type=str)
+    return parser.parse_args()
 
 
 if __name__ == '__main__':
-    name1, agent1, name2, agent2 = parse_arguments()
+    args = parse_arguments()
     start = time.time()
-    testperf(name1, agent1, name2, agent2)
+    if args.duplicate:
+        testperf_duplicate(args.agent_name1, args.agent_name2, args.num_game, args.schedule, args.seed)
+    else:
+        testperf(args.agent_name1, args.agent1, args.agent_name2, args.agent2, args.seed)
     end = time.time()
 
     print("\n Time taken to play: %.4f seconds" % (end - start))
\ No newline at end of file